@@ -1,4 +1,6 @@
 from django.contrib import admin
+
+from core.admin import SelectRelatedAdminMixin
 from .models import (
     Character, CharacterAbilities, CharacterSkill, CharacterSavingThrow,
     CharacterProficiency, CharacterEquipment, CharacterSpell,
@@ -71,12 +73,14 @@ class CharacterFeatInline(admin.TabularInline):
 
 
 @admin.register(Character)
-class CharacterAdmin(admin.ModelAdmin):
+class CharacterAdmin(SelectRelatedAdminMixin, admin.ModelAdmin):
     list_display = ('character_name', 'user', 'level_display', 'species', 'dnd_class', 'character_state', 'last_modified_date')
     list_filter = ('character_state', 'dnd_class', 'species', 'level', 'is_complete')
     search_fields = ('character_name', 'user__username', 'user__email')
     ordering = ('-last_modified_date',)
     readonly_fields = ('created_date', 'last_modified_date', 'proficiency_bonus')
+    select_related_fields = ('user', 'dnd_class', 'subclass', 'background', 'species')
+    prefetch_related_fields = ('skills', 'equipment', 'spells', 'feats')
 
     fieldsets = (
         ('Basic Info', {
@@ -107,14 +111,6 @@ class CharacterAdmin(admin.ModelAdmin):
         CharacterFeatInline,
     ]
 
-    def get_queryset(self, request):
-        """Optimize queryset with select_related"""
-        return super().get_queryset(request).select_related(
-            'user', 'dnd_class', 'subclass', 'background', 'species'
-        ).prefetch_related(
-            'skills', 'equipment', 'spells', 'feats'
-        )
-
     def save_related(self, request, form, formsets, change):
         """Auto-create CharacterAbilities and CharacterDetails if they don't exist"""
         super().save_related(request, form, formsets, change)
@@ -0,0 +1,13 @@
+"""
+Filter sets for Character API
+"""
+from django_filters import rest_framework as filters
+
+from .models import Character
+
+
+class CharacterFilter(filters.FilterSet):
+    """Declared once so DjangoFilterBackend doesn't build a FilterSet class per request"""
+    class Meta:
+        model = Character
+        fields = ['character_state', 'dnd_class', 'species', 'level', 'is_complete']
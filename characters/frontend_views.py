@@ -8,11 +8,13 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.urls import reverse
-from django.http import JsonResponse
+from django.http import Http404, JsonResponse
 from django.views.decorators.http import require_http_methods
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import TemplateView, ListView
+from django.db import transaction
 from django.db.models import Q
+from django.utils import timezone
 
 from .models import Character
 from game_content.models import DnDClass, Species, Background, Equipment, Spell, Skill
@@ -138,11 +140,14 @@ def character_save_draft(request, character_id):
     Save character as draft via AJAX
     """
     try:
-        character = get_object_or_404(Character, id=character_id, user=request.user)
-
         # Process form data and save
         # This would be implemented based on the specific step data
-        character.save()
+        # Stamp the draft with a single UPDATE; queryset updates skip auto_now
+        updated_rows = Character.objects.filter(id=character_id, user=request.user).update(
+            last_modified_date=timezone.now()
+        )
+        if not updated_rows:
+            raise Http404('No Character matches the given query.')
 
         return JsonResponse({'success': True, 'message': 'Draft saved successfully'})
 
@@ -173,22 +178,29 @@ def character_duplicate(request, character_id):
     """
     Duplicate an existing character
     """
-    original = get_object_or_404(Character, id=character_id, user=request.user)
+    original = get_object_or_404(
+        Character.objects.select_related('abilities'), id=character_id, user=request.user
+    )
 
     if request.method == 'POST':
-        # Create a copy
-        duplicate = Character.objects.get(id=original.id)
-        duplicate.pk = None  # This will create a new instance when saved
-        duplicate.character_name = f"{original.character_name} (Copy)"
-        duplicate.is_complete = False
-        duplicate.save()
-
-        # Copy related objects if they exist
-        if hasattr(original, 'abilities'):
-            abilities = original.abilities
-            abilities.pk = None
-            abilities.character = duplicate
-            abilities.save()
+        # Abilities came with the character; None when it has none
+        abilities = getattr(original, 'abilities', None)
+
+        with transaction.atomic():
+            # Turn the loaded instance into the copy rather than fetching it again
+            duplicate = original
+            duplicate.pk = None  # This will create a new instance when saved
+            duplicate._state.adding = True
+            duplicate.character_name = f"{duplicate.character_name} (Copy)"
+            duplicate.is_complete = False
+            duplicate.save()
+
+            # Copy related objects if they exist
+            if abilities is not None:
+                abilities.pk = None
+                abilities._state.adding = True
+                abilities.character = duplicate
+                abilities.save()
 
         # Copy other relationships as needed...
 
@@ -402,7 +414,7 @@ def handle_step_submission(request, character, step):
             try:
                 dnd_class = DnDClass.objects.get(id=class_id)
                 character.dnd_class = dnd_class
-                character.save()
+                character.save(update_fields=['dnd_class', 'last_modified_date'])
                 messages.success(request, f'Class "{dnd_class.name}" selected!')
             except DnDClass.DoesNotExist:
                 messages.error(request, 'Invalid class selected.')
@@ -435,11 +447,13 @@ def handle_step_submission(request, character, step):
         # Handle origin selection
         species_id = request.POST.get('species_id')
         background_id = request.POST.get('background_id')
+        update_fields = ['last_modified_date']
 
         if species_id:
             try:
                 species = Species.objects.get(id=species_id)
                 character.species = species
+                update_fields.append('species')
             except Species.DoesNotExist:
                 messages.error(request, 'Invalid species selected.')
 
@@ -447,10 +461,11 @@ def handle_step_submission(request, character, step):
             try:
                 background = Background.objects.get(id=background_id)
                 character.background = background
+                update_fields.append('background')
             except Background.DoesNotExist:
                 messages.error(request, 'Invalid background selected.')
 
-        character.save()
+        character.save(update_fields=update_fields)
 
     # Continue for other steps...
 
@@ -460,6 +475,6 @@ def handle_step_submission(request, character, step):
     else:
         # Final step - mark character as complete
         character.is_complete = True
-        character.save()
+        character.save(update_fields=['is_complete', 'last_modified_date'])
         messages.success(request, f'Character "{character.character_name}" created successfully!')
         return redirect('character_sheet', character_id=character.id)
\ No newline at end of file
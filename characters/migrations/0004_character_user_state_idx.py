@@ -0,0 +1,17 @@
+# Generated by Django 4.2.16 on 2026-10-15 22:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('characters', '0003_character_user_modified_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='character',
+            index=models.Index(fields=['user', 'character_state', '-last_modified_date'], name='character_user_state_idx'),
+        ),
+    ]
@@ -49,6 +49,15 @@ class Character(models.Model):
     class Meta:
         unique_together = ['user', 'character_name']
         ordering = ['-last_modified_date']
+        indexes = [
+            # Character list: one user's characters, most recently edited first
+            models.Index(fields=['user', '-last_modified_date'], name='character_user_modified_idx'),
+            # The same list filtered by state (drafts vs complete)
+            models.Index(
+                fields=['user', 'character_state', '-last_modified_date'],
+                name='character_user_state_idx'
+            ),
+        ]
 
     def __str__(self):
         return f"{self.character_name} ({self.user.username})"
@@ -119,6 +128,16 @@ class CharacterAbilities(models.Model):
     wisdom_score = models.PositiveIntegerField(default=10)
     charisma_score = models.PositiveIntegerField(default=10)
 
+    # Score column for each ability abbreviation, so single lookups touch one field
+    ABILITY_SCORE_FIELDS = {
+        'STR': 'strength_score',
+        'DEX': 'dexterity_score',
+        'CON': 'constitution_score',
+        'INT': 'intelligence_score',
+        'WIS': 'wisdom_score',
+        'CHA': 'charisma_score',
+    }
+
     class Meta:
         verbose_name_plural = "Character Abilities"
 
@@ -156,15 +175,10 @@ class CharacterAbilities(models.Model):
 
     def get_modifier_for_ability(self, ability_name):
         """Get modifier for ability by name (STR, DEX, etc.)"""
-        ability_map = {
-            'STR': self.strength_modifier,
-            'DEX': self.dexterity_modifier,
-            'CON': self.constitution_modifier,
-            'INT': self.intelligence_modifier,
-            'WIS': self.wisdom_modifier,
-            'CHA': self.charisma_modifier,
-        }
-        return ability_map.get(ability_name, 0)
+        field_name = self.ABILITY_SCORE_FIELDS.get(ability_name)
+        if field_name is None:
+            return 0
+        return self.modifier(getattr(self, field_name))
 
 
 class CharacterSkill(models.Model):
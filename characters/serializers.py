@@ -1,6 +1,8 @@
 """
 Serializers for Character API
 """
+import copy
+
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 
@@ -17,6 +19,22 @@ from game_content.serializers import (
 User = get_user_model()
 
 
+class CachedFieldsMixin:
+    """
+    Build a ModelSerializer's fields from model introspection once per class and give
+    each instance a deep copy, since the field set doesn't vary between requests
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        # Look in the class's own __dict__ so subclasses don't reuse a parent's fields
+        cached = cls.__dict__.get('_cached_fields')
+        if cached is None:
+            cached = super().get_fields()
+            cls._cached_fields = cached
+        return copy.deepcopy(cached)
+
+
 class CharacterAbilitiesSerializer(serializers.ModelSerializer):
     """Serializer for Character Abilities with calculated modifiers"""
     strength_modifier = serializers.ReadOnlyField()
@@ -34,6 +52,7 @@ class CharacterAbilitiesSerializer(serializers.ModelSerializer):
             'strength_modifier', 'dexterity_modifier', 'constitution_modifier',
             'intelligence_modifier', 'wisdom_modifier', 'charisma_modifier'
         ]
+        read_only_fields = fields
 
 
 class CharacterDetailsSerializer(serializers.ModelSerializer):
@@ -45,6 +64,7 @@ class CharacterDetailsSerializer(serializers.ModelSerializer):
             'portrait_url', 'personality_traits', 'ideals', 'bonds', 'flaws',
             'backstory', 'notes'
         ]
+        read_only_fields = fields
 
 
 class CharacterSkillSerializer(serializers.ModelSerializer):
@@ -56,6 +76,7 @@ class CharacterSkillSerializer(serializers.ModelSerializer):
     class Meta:
         model = CharacterSkill
         fields = ['skill', 'skill_id', 'proficiency_type', 'bonus']
+        read_only_fields = fields
 
 
 class CharacterSavingThrowSerializer(serializers.ModelSerializer):
@@ -65,6 +86,7 @@ class CharacterSavingThrowSerializer(serializers.ModelSerializer):
     class Meta:
         model = CharacterSavingThrow
         fields = ['ability_name', 'is_proficient', 'bonus']
+        read_only_fields = fields
 
 
 class CharacterProficiencySerializer(serializers.ModelSerializer):
@@ -72,6 +94,7 @@ class CharacterProficiencySerializer(serializers.ModelSerializer):
     class Meta:
         model = CharacterProficiency
         fields = ['proficiency_type', 'proficiency_name']
+        read_only_fields = fields
 
 
 class CharacterEquipmentSerializer(serializers.ModelSerializer):
@@ -82,6 +105,7 @@ class CharacterEquipmentSerializer(serializers.ModelSerializer):
     class Meta:
         model = CharacterEquipment
         fields = ['equipment', 'equipment_id', 'quantity', 'equipped', 'attuned']
+        read_only_fields = fields
 
 
 class CharacterSpellSerializer(serializers.ModelSerializer):
@@ -92,6 +116,7 @@ class CharacterSpellSerializer(serializers.ModelSerializer):
     class Meta:
         model = CharacterSpell
         fields = ['spell', 'spell_id', 'always_prepared', 'prepared']
+        read_only_fields = fields
 
 
 class CharacterFeatSerializer(serializers.ModelSerializer):
@@ -99,6 +124,7 @@ class CharacterFeatSerializer(serializers.ModelSerializer):
     class Meta:
         model = CharacterFeat
         fields = ['feat', 'source', 'choice_made']
+        read_only_fields = fields
 
 
 class CharacterLanguageSerializer(serializers.ModelSerializer):
@@ -106,9 +132,10 @@ class CharacterLanguageSerializer(serializers.ModelSerializer):
     class Meta:
         model = CharacterLanguage
         fields = ['language']
+        read_only_fields = fields
 
 
-class CharacterListSerializer(serializers.ModelSerializer):
+class CharacterListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Compact serializer for character list view"""
     dnd_class = ClassSummarySerializer(read_only=True)
     species = SpeciesSummarySerializer(read_only=True)
@@ -122,9 +149,10 @@ class CharacterListSerializer(serializers.ModelSerializer):
             'dnd_class', 'species', 'background', 'character_state',
             'is_complete', 'last_modified_date'
         ]
+        read_only_fields = fields
 
 
-class CharacterCreateSerializer(serializers.ModelSerializer):
+class CharacterCreateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for creating a new character"""
     class Meta:
         model = Character
@@ -146,7 +174,7 @@ class CharacterCreateSerializer(serializers.ModelSerializer):
         return character
 
 
-class CharacterDetailSerializer(serializers.ModelSerializer):
+class CharacterDetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Complete serializer for character detail view"""
     dnd_class = ClassSummarySerializer(read_only=True)
     species = SpeciesSummarySerializer(read_only=True)
@@ -205,7 +233,7 @@ class CharacterDetailSerializer(serializers.ModelSerializer):
         return instance
 
 
-class CharacterAbilitiesUpdateSerializer(serializers.ModelSerializer):
+class CharacterAbilitiesUpdateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for updating character abilities"""
     class Meta:
         model = CharacterAbilities
@@ -224,6 +252,17 @@ class CharacterAbilitiesUpdateSerializer(serializers.ModelSerializer):
         return data
 
 
+class CharacterStepUpdateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Validate the character fields the class/background/species/alignment step endpoints
+    write. Related ids must exist; used with partial=True so each step sends only its own
+    fields.
+    """
+    class Meta:
+        model = Character
+        fields = ['dnd_class', 'subclass', 'background', 'species', 'alignment']
+
+
 class CharacterDetailsUpdateSerializer(serializers.ModelSerializer):
     """Serializer for updating character details"""
     class Meta:
@@ -10,7 +10,7 @@ Handles all character stat calculations including:
 - Saving throws
 - Spell save DC and attack bonuses
 """
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from django.db.models import Q
 
 from ..models import Character, CharacterAbilities, CharacterEquipment, CharacterSkill
@@ -75,8 +75,19 @@ class CharacterCalculationService:
 
         return max(1, max_hp)  # Minimum 1 HP
 
+    @staticmethod
+    def get_equipment_rows(character: Character) -> List[CharacterEquipment]:
+        """Load the character's equipment with item and armor details in one query"""
+        # Query the model directly: chaining off character.equipment would inherit the
+        # column restrictions of a prefetched queryset and lazy-load the rest per row
+        return list(
+            CharacterEquipment.objects.filter(character=character)
+            .select_related('equipment__armor').order_by('pk')
+        )
+
     @classmethod
-    def calculate_armor_class(cls, character: Character) -> int:
+    def calculate_armor_class(cls, character: Character,
+                              equipment: Optional[List[CharacterEquipment]] = None) -> int:
         """
         Calculate Armor Class based on equipment and abilities
 
@@ -86,6 +97,8 @@ class CharacterCalculationService:
         - Medium Armor: armor_AC + min(DEX modifier, 2)
         - Heavy Armor: armor_AC (no DEX bonus)
         - Shield: +2 AC if equipped
+
+        equipment: rows from get_equipment_rows(), loaded here when not given
         """
         if not hasattr(character, 'abilities'):
             return 10
@@ -96,13 +109,16 @@ class CharacterCalculationService:
         # Start with unarmored AC
         base_ac = 10 + dex_modifier
 
+        if equipment is None:
+            equipment = cls.get_equipment_rows(character)
+        equipped = [row for row in equipment if row.equipped]
+
         # Check for equipped armor
-        equipped_armor = character.equipment.filter(
-            equipped=True,
-            equipment__armor__isnull=False
-        ).select_related('equipment__armor').first()
+        equipped_armor = next(
+            (row for row in equipped if hasattr(row.equipment, 'armor')), None
+        )
 
-        if equipped_armor and hasattr(equipped_armor.equipment, 'armor'):
+        if equipped_armor:
             armor = equipped_armor.equipment.armor
             base_ac = armor.base_ac
 
@@ -114,10 +130,7 @@ class CharacterCalculationService:
             # Heavy armor gets no DEX bonus
 
         # Check for equipped shield
-        has_shield = character.equipment.filter(
-            equipped=True,
-            equipment__name__icontains='shield'
-        ).exists()
+        has_shield = any('shield' in row.equipment.name.lower() for row in equipped)
 
         if has_shield:
             base_ac += 2
@@ -171,10 +184,13 @@ class CharacterCalculationService:
         return character_skill.bonus
 
     @classmethod
-    def calculate_saving_throw_bonus(cls, character: Character, ability_name: str) -> int:
+    def calculate_saving_throw_bonus(cls, character: Character, ability_name: str,
+                                     proficient_saves: Optional[Set[str]] = None) -> int:
         """
         Calculate saving throw bonus for a specific ability
         Formula: ability_modifier + proficiency_bonus (if proficient)
+
+        proficient_saves: ability names the character is proficient in, queried when not given
         """
         if not hasattr(character, 'abilities'):
             return 0
@@ -182,10 +198,13 @@ class CharacterCalculationService:
         ability_modifier = character.abilities.get_modifier_for_ability(ability_name)
 
         # Check if proficient in this saving throw
-        is_proficient = character.saving_throws.filter(
-            ability_name=ability_name.upper(),
-            is_proficient=True
-        ).exists()
+        if proficient_saves is not None:
+            is_proficient = ability_name.upper() in proficient_saves
+        else:
+            is_proficient = character.saving_throws.filter(
+                ability_name=ability_name.upper(),
+                is_proficient=True
+            ).exists()
 
         if is_proficient:
             proficiency_bonus = cls.calculate_proficiency_bonus(character.level)
@@ -306,22 +325,27 @@ class CharacterCalculationService:
         }
 
     @classmethod
-    def calculate_current_encumbrance(cls, character: Character) -> float:
+    def calculate_current_encumbrance(cls, character: Character,
+                                      equipment: Optional[List[CharacterEquipment]] = None) -> float:
         """Calculate current total weight carried"""
-        total_weight = 0.0
+        if equipment is None:
+            equipment = cls.get_equipment_rows(character)
 
-        for equipment in character.equipment.select_related('equipment'):
-            item_weight = float(equipment.equipment.weight or 0)
-            total_weight += item_weight * equipment.quantity
+        total_weight = 0.0
+        for row in equipment:
+            item_weight = float(row.equipment.weight or 0)
+            total_weight += item_weight * row.quantity
 
         return total_weight
 
     @classmethod
-    def get_encumbrance_status(cls, character: Character) -> str:
+    def get_encumbrance_status(cls, character: Character,
+                               current_weight: Optional[float] = None) -> str:
         """
         Get encumbrance status: 'normal', 'encumbered', 'heavily_encumbered', 'overloaded'
         """
-        current_weight = cls.calculate_current_encumbrance(character)
+        if current_weight is None:
+            current_weight = cls.calculate_current_encumbrance(character)
         capacity = cls.calculate_carrying_capacity(character)
 
         if current_weight <= capacity['encumbered']:
@@ -339,32 +363,41 @@ class CharacterCalculationService:
         Calculate all character statistics at once
         Returns a comprehensive dictionary of calculated stats
         """
-        if not character or not hasattr(character, 'abilities'):
+        # One descriptor lookup for the related row instead of one per ability
+        abilities = getattr(character, 'abilities', None) if character else None
+        if abilities is None:
             return {}
 
+        # Read equipment and saving throw proficiencies once and share them between the
+        # calculations instead of each one querying for itself
+        equipment = cls.get_equipment_rows(character)
+        proficient_saves = set(
+            character.saving_throws.filter(is_proficient=True).values_list('ability_name', flat=True)
+        )
+        current_encumbrance = cls.calculate_current_encumbrance(character, equipment)
+
         stats = {
             'ability_modifiers': {
-                'strength': cls.calculate_ability_modifier(character.abilities.strength_score),
-                'dexterity': cls.calculate_ability_modifier(character.abilities.dexterity_score),
-                'constitution': cls.calculate_ability_modifier(character.abilities.constitution_score),
-                'intelligence': cls.calculate_ability_modifier(character.abilities.intelligence_score),
-                'wisdom': cls.calculate_ability_modifier(character.abilities.wisdom_score),
-                'charisma': cls.calculate_ability_modifier(character.abilities.charisma_score),
+                ability: cls.calculate_ability_modifier(getattr(abilities, f"{ability}_score"))
+                for ability in ('strength', 'dexterity', 'constitution',
+                                'intelligence', 'wisdom', 'charisma')
             },
             'proficiency_bonus': cls.calculate_proficiency_bonus(character.level),
             'max_hp': cls.calculate_max_hp(character),
-            'armor_class': cls.calculate_armor_class(character),
+            'armor_class': cls.calculate_armor_class(character, equipment),
             'initiative': cls.calculate_initiative(character),
             'spell_save_dc': cls.calculate_spell_save_dc(character),
             'spell_attack_bonus': cls.calculate_spell_attack_bonus(character),
             'carrying_capacity': cls.calculate_carrying_capacity(character),
-            'current_encumbrance': cls.calculate_current_encumbrance(character),
-            'encumbrance_status': cls.get_encumbrance_status(character),
+            'current_encumbrance': current_encumbrance,
+            'encumbrance_status': cls.get_encumbrance_status(character, current_encumbrance),
         }
 
         # Calculate saving throws
         stats['saving_throws'] = {}
         for ability in ['STR', 'DEX', 'CON', 'INT', 'WIS', 'CHA']:
-            stats['saving_throws'][ability.lower()] = cls.calculate_saving_throw_bonus(character, ability)
+            stats['saving_throws'][ability.lower()] = cls.calculate_saving_throw_bonus(
+                character, ability, proficient_saves
+            )
 
         return stats
\ No newline at end of file
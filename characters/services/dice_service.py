@@ -13,6 +13,9 @@ import re
 from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
+# Pattern: optional number, 'd', number, optional +/- number
+_DICE_NOTATION_RE = re.compile(r'^(\d+)?d(\d+)([+-]\d+)?$')
+
 
 @dataclass
 class DiceRoll:
@@ -49,6 +52,17 @@ class AdvantageRoll:
 class DiceRollerService:
     """Service class for all dice rolling operations"""
 
+    ABILITY_NAMES = ('strength', 'dexterity', 'constitution', 'intelligence', 'wisdom', 'charisma')
+
+    # Simple name generation - in a real implementation,
+    # this would use extensive name tables
+    HUMAN_NAMES = {
+        'male': ['Aerdyn', 'Beiro', 'Carric', 'Drannor', 'Enna', 'Galinndan'],
+        'female': ['Adrie', 'Birel', 'Caelynn', 'Dayereth', 'Enna', 'Galinndan']
+    }
+    HUMAN_NAMES['any'] = HUMAN_NAMES['male'] + HUMAN_NAMES['female']
+    NAME_SYLLABLES = ['ad', 'al', 'am', 'an', 'ar', 'ea', 'el', 'er', 'in', 'on', 'or', 'ou']
+
     @staticmethod
     def roll_die(sides: int) -> int:
         """Roll a single die with specified number of sides"""
@@ -128,11 +142,7 @@ class DiceRollerService:
         - XdY+Z (e.g., "3d6+2", "1d20+5")
         - XdY-Z (e.g., "2d8-1")
         """
-        notation = notation.strip().lower().replace(" ", "")
-
-        # Pattern: optional number, 'd', number, optional +/- number
-        pattern = r'^(\d+)?d(\d+)([+-]\d+)?$'
-        match = re.match(pattern, notation)
+        match = cls._match_dice_notation(notation)
 
         if not match:
             raise ValueError(f"Invalid dice notation: {notation}")
@@ -166,7 +176,23 @@ class DiceRollerService:
         Returns:
             List of DiceRoll objects
         """
-        return [cls.roll_ability_score() for _ in range(count)]
+        # Draw every die up front in one call instead of a roll_dice() per score;
+        # drop-lowest is then just the row sum minus its minimum
+        faces = random.choices(range(1, 7), k=count * 4)
+
+        results = []
+        for i in range(0, count * 4, 4):
+            rolls = faces[i:i + 4]
+            results.append(DiceRoll(
+                dice_count=4,
+                dice_size=6,
+                modifier=0,
+                individual_rolls=rolls,
+                total=sum(rolls) - min(rolls),
+                description="4d6 drop lowest 1"
+            ))
+
+        return results
 
     @classmethod
     def roll_standard_ability_scores(cls) -> Dict[str, DiceRoll]:
@@ -176,10 +202,7 @@ class DiceRollerService:
         Returns:
             Dict mapping ability names to DiceRoll results
         """
-        abilities = ['strength', 'dexterity', 'constitution', 'intelligence', 'wisdom', 'charisma']
-        rolls = cls.roll_ability_scores(6)
-
-        return dict(zip(abilities, rolls))
+        return dict(zip(cls.ABILITY_NAMES, cls.roll_ability_scores(len(cls.ABILITY_NAMES))))
 
     @classmethod
     def roll_with_advantage(cls, sides: int = 20, modifier: int = 0,
@@ -432,26 +455,32 @@ class DiceRollerService:
         Returns:
             Random character name
         """
-        # Simple name generation - in a real implementation,
-        # this would use extensive name tables
-        human_names = {
-            'male': ['Aerdyn', 'Beiro', 'Carric', 'Drannor', 'Enna', 'Galinndan'],
-            'female': ['Adrie', 'Birel', 'Caelynn', 'Dayereth', 'Enna', 'Galinndan']
-        }
+        return cls.generate_character_names(species, gender, 1)[0]
 
-        if species.lower() == 'human':
-            if gender in human_names:
-                names = human_names[gender]
-            else:
-                names = human_names['male'] + human_names['female']
+    @classmethod
+    def generate_character_names(cls, species: str = 'Human', gender: str = 'any',
+                                 count: int = 1) -> List[str]:
+        """
+        Generate several random D&D character names in one call
+
+        Args:
+            species: Character species/race
+            gender: 'male', 'female', or 'any'
+            count: Number of names to generate
 
-            return random.choice(names)
+        Returns:
+            List of random character names
+        """
+        if species.lower() == 'human':
+            names = cls.HUMAN_NAMES.get(gender, cls.HUMAN_NAMES['any'])
+            return random.choices(names, k=count)
 
-        # Default random name
-        syllables = ['ad', 'al', 'am', 'an', 'ar', 'ea', 'el', 'er', 'in', 'on', 'or', 'ou']
-        name_length = random.randint(2, 3)
-        name = ''.join(random.choices(syllables, k=name_length))
-        return name.capitalize()
+        # Default random names
+        syllables = cls.NAME_SYLLABLES
+        return [
+            ''.join(random.choices(syllables, k=random.randint(2, 3))).capitalize()
+            for _ in range(count)
+        ]
 
     @classmethod
     def validate_dice_notation(cls, notation: str) -> bool:
@@ -464,9 +493,11 @@ class DiceRollerService:
         Returns:
             True if valid notation
         """
-        try:
-            notation = notation.strip().lower().replace(" ", "")
-            pattern = r'^(\d+)?d(\d+)([+-]\d+)?$'
-            return bool(re.match(pattern, notation))
-        except:
-            return False
\ No newline at end of file
+        return cls._match_dice_notation(notation) is not None
+
+    @staticmethod
+    def _match_dice_notation(notation: str) -> Optional[re.Match]:
+        """Normalize notation and match it against the precompiled dice pattern"""
+        if not isinstance(notation, str):
+            return None
+        return _DICE_NOTATION_RE.match(notation.strip().lower().replace(" ", ""))
\ No newline at end of file
@@ -10,16 +10,49 @@ Provides intelligent recommendations for character creation including:
 - Feat recommendations
 - Character build synergy analysis
 """
-from typing import Dict, List, Optional, Tuple, Union
-from django.db.models import Q
+import hashlib
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef, Q
 
-from ..models import Character, CharacterAbilities
+from ..models import Character, CharacterAbilities, CharacterEquipment, CharacterSkill
 from game_content.models import DnDClass, Background, Species, Feat, Spell, Equipment
 
+_ABILITY_NAMES = ('strength', 'dexterity', 'constitution', 'intelligence', 'wisdom', 'charisma')
+
+
+def _primary_ability_score(abilities: CharacterAbilities, primary_ability: str) -> int:
+    """Read the score for a class's primary ability, stored as an abbreviation like 'STR'"""
+    field_name = CharacterAbilities.ABILITY_SCORE_FIELDS.get(
+        primary_ability, f"{primary_ability.lower()}_score"
+    )
+    return getattr(abilities, field_name)
+
 
 class RecommendationService:
     """Service class for providing character creation recommendations"""
 
+    # Cache key/TTL for per-class build recommendations served by the utility API, keyed
+    # on the resolved class's pk so name variants and renames can't leave stale entries
+    BUILD_RECOMMENDATIONS_CACHE_KEY = 'build_recs:v2:{class_id}'
+    BUILD_RECOMMENDATIONS_CACHE_TTL = 60 * 60
+
+    # Shared-cache key/TTL for get_dnd_class(); the name is hashed because it comes
+    # straight from request URLs
+    DND_CLASS_CACHE_KEY = 'dnd_class:v1:{name_hash}'
+    DND_CLASS_CACHE_TTL = 15 * 60
+
+    # Character columns read by the build analysis methods (see get_character_for_analysis)
+    ANALYSIS_CHARACTER_FIELDS = (
+        'id', 'user_id', 'character_name',
+        'dnd_class__name', 'dnd_class__primary_ability',
+        'species__name', 'background__name',
+        'abilities__strength_score', 'abilities__dexterity_score',
+        'abilities__constitution_score', 'abilities__intelligence_score',
+        'abilities__wisdom_score', 'abilities__charisma_score',
+    )
+
     # Playstyle mappings for class recommendations
     PLAYSTYLE_TO_CLASSES = {
         'damage_dealer': {
@@ -96,18 +129,29 @@ class RecommendationService:
         Returns:
             Dict with 'primary' and 'secondary' class recommendations
         """
+        # Playstyle data is static, so results are memoized per (playstyle set, beginner).
+        # Unknown playstyles are ignored anyway, so dropping them keeps the key space small.
+        known = frozenset(p for p in playstyles if p in cls.PLAYSTYLE_TO_CLASSES)
+        cached = cls._recommend_classes_cached(known, experience_level == 'beginner')
+
+        # Hand out copies so callers can't mutate the cached lists
+        return {key: list(classes) for key, classes in cached.items()}
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _recommend_classes_cached(playstyles: FrozenSet[str], beginner: bool) -> Dict[str, List[str]]:
+        """Memoized body of recommend_classes_by_playstyle over known playstyles"""
         primary_classes = set()
         secondary_classes = set()
 
         # Add beginner-friendly classes for new players
-        if experience_level == 'beginner':
-            playstyles = playstyles + ['beginner_friendly']
+        if beginner:
+            playstyles = playstyles | {'beginner_friendly'}
 
         for playstyle in playstyles:
-            if playstyle in cls.PLAYSTYLE_TO_CLASSES:
-                mapping = cls.PLAYSTYLE_TO_CLASSES[playstyle]
-                primary_classes.update(mapping['primary'])
-                secondary_classes.update(mapping['secondary'])
+            mapping = RecommendationService.PLAYSTYLE_TO_CLASSES[playstyle]
+            primary_classes.update(mapping['primary'])
+            secondary_classes.update(mapping['secondary'])
 
         # Remove primary classes from secondary list
         secondary_classes -= primary_classes
@@ -117,6 +161,29 @@ class RecommendationService:
             'secondary': sorted(list(secondary_classes))
         }
 
+    @classmethod
+    def dnd_class_cache_key(cls, name: str) -> str:
+        """Cache key for get_dnd_class(name)"""
+        return cls.DND_CLASS_CACHE_KEY.format(name_hash=hashlib.md5(name.encode()).hexdigest())
+
+    @classmethod
+    def get_dnd_class(cls, name: str) -> DnDClass:
+        """
+        Look up a class by name through the shared cache, so every worker sees the same
+        entry. The characters app deletes it when the class is saved or deleted; a
+        renamed class can still resolve under its old name for up to DND_CLASS_CACHE_TTL.
+        Each call returns its own instance, unpickled from the cache.
+
+        Raises:
+            DnDClass.DoesNotExist: if there is no class with that name (misses aren't cached)
+        """
+        cache_key = cls.dnd_class_cache_key(name)
+        dnd_class = cache.get(cache_key)
+        if dnd_class is None:
+            dnd_class = DnDClass.objects.get(name=name)
+            cache.set(cache_key, dnd_class, cls.DND_CLASS_CACHE_TTL)
+        return dnd_class
+
     @classmethod
     def recommend_background_for_class(cls, class_name: str) -> List[str]:
         """
@@ -459,6 +526,58 @@ class RecommendationService:
 
         return recommendations[:6]  # Return top 6 recommendations
 
+    @classmethod
+    def get_character_for_analysis(cls, character_id: int, user) -> Character:
+        """
+        Load a character with the columns the build analysis reads, and annotate the
+        equipment/skill checks so analysis needs no further queries
+
+        Raises:
+            Character.DoesNotExist: if no such character belongs to the user
+        """
+        return Character.objects.select_related(
+            'dnd_class', 'species', 'background', 'abilities'
+        ).only(
+            *cls.ANALYSIS_CHARACTER_FIELDS
+        ).annotate(
+            has_equipped_armor=Exists(CharacterEquipment.objects.filter(
+                character=OuterRef('pk'), equipped=True, equipment__armor__isnull=False
+            )),
+            has_skills=Exists(CharacterSkill.objects.filter(character=OuterRef('pk'))),
+        ).get(id=character_id, user=user)
+
+    @classmethod
+    def analyze_character_build(cls, character: Character) -> Dict:
+        """
+        Run the full build analysis for a character
+
+        Args:
+            character: Character to analyze, ideally from get_character_for_analysis
+
+        Returns:
+            Dict with optimization score, synergy analysis, and suggestions
+        """
+        suggestions = []
+        abilities = getattr(character, 'abilities', None)
+        if abilities is not None:
+            # Scores come from the row already joined by get_character_for_analysis
+            scores = [getattr(abilities, f"{name}_score") for name in _ABILITY_NAMES]
+
+            suggestions.append({
+                'type': 'ability_scores',
+                'current_assignment': dict(zip(_ABILITY_NAMES, scores)),
+                'optimal_assignment': cls.recommend_ability_score_assignment(
+                    character.dnd_class.name, scores
+                )
+            })
+
+        return {
+            'optimization_score': cls.get_build_optimization_score(character),
+            'synergy_analysis': cls.analyze_character_synergies(character),
+            'suggestions': suggestions,
+            'character_name': character.character_name or 'Unnamed Character'
+        }
+
     @classmethod
     def analyze_character_synergies(cls, character: Character) -> Dict[str, List[str]]:
         """
@@ -485,7 +604,7 @@ class RecommendationService:
 
         # Analyze ability score allocation
         primary_ability = character.dnd_class.primary_ability
-        primary_score = getattr(abilities, f"{primary_ability.lower()}_score")
+        primary_score = _primary_ability_score(abilities, primary_ability)
 
         if primary_score >= 15:
             analysis['strengths'].append(f"Strong {primary_ability} ({primary_score}) for {class_name}")
@@ -531,15 +650,16 @@ class RecommendationService:
             if character.species.name in recommended_species:
                 analysis['strengths'].append(f"{character.species.name} species complements {class_name} abilities")
 
-        # Equipment recommendations
-        if hasattr(character, 'equipment'):
-            equipped_armor = character.equipment.filter(
+        # Equipment recommendations - use the get_character_for_analysis annotation if present
+        has_equipped_armor = getattr(character, 'has_equipped_armor', None)
+        if has_equipped_armor is None:
+            has_equipped_armor = character.equipment.filter(
                 equipped=True,
                 equipment__armor__isnull=False
-            ).first()
+            ).exists()
 
-            if not equipped_armor and class_name not in ['Barbarian', 'Monk']:
-                analysis['suggestions'].append("Consider equipping armor for better AC")
+        if not has_equipped_armor and class_name not in ['Barbarian', 'Monk']:
+            analysis['suggestions'].append("Consider equipping armor for better AC")
 
         return analysis
 
@@ -562,7 +682,7 @@ class RecommendationService:
 
         # Primary ability optimization (30 points)
         primary_ability = character.dnd_class.primary_ability
-        primary_score = getattr(character.abilities, f"{primary_ability.lower()}_score")
+        primary_score = _primary_ability_score(character.abilities, primary_ability)
 
         if primary_score >= 15:
             score += 30
@@ -593,14 +713,7 @@ class RecommendationService:
                 score += 15
 
         # Balanced ability scores (10 points)
-        all_scores = [
-            character.abilities.strength_score,
-            character.abilities.dexterity_score,
-            character.abilities.constitution_score,
-            character.abilities.intelligence_score,
-            character.abilities.wisdom_score,
-            character.abilities.charisma_score
-        ]
+        all_scores = [getattr(character.abilities, f"{name}_score") for name in _ABILITY_NAMES]
 
         # Check for no dump stats (no scores below 8)
         if all(score >= 8 for score in all_scores):
@@ -609,7 +722,10 @@ class RecommendationService:
         # Skills optimization (10 points)
         # This would check if character has optimal skill selections
         # Simplified for now
-        if hasattr(character, 'skills') and character.skills.exists():
+        has_skills = getattr(character, 'has_skills', None)
+        if has_skills is None:
+            has_skills = character.skills.exists()
+        if has_skills:
             score += 10
 
         # Determine grade
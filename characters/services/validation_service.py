@@ -11,11 +11,40 @@ Handles all character validation including:
 """
 from typing import Dict, List, Optional, Tuple
 from django.core.exceptions import ValidationError
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Prefetch, Q
 
-from ..models import Character, CharacterAbilities, CharacterEquipment, CharacterSpell
+from ..models import (
+    Character, CharacterAbilities, CharacterEquipment, CharacterFeat, CharacterSpell
+)
+from .calculation_service import CharacterCalculationService
 from game_content.models import Skill, Spell
 
+# D&D rule constants shared across validators
+_ABILITY_NAMES = ('strength', 'dexterity', 'constitution', 'intelligence', 'wisdom', 'charisma')
+_STANDARD_ARRAY = (15, 14, 13, 12, 10, 8)
+_POINT_BUY_COSTS = {8: 0, 9: 1, 10: 2, 11: 3, 12: 4, 13: 5, 14: 7, 15: 9}
+_ASI_STANDARD = (4, 8, 12, 16, 19)
+_ASI_FIGHTER = (4, 6, 8, 12, 14, 16, 19)
+_ASI_ROGUE = (4, 8, 10, 12, 16, 19)
+_ABILITY_BY_ABBREVIATION = {name[:3]: name for name in _ABILITY_NAMES}
+
+
+def _ability_key(ability: str) -> str:
+    """Normalize 'STR' / 'Strength' style ability names to the full lowercase name"""
+    key = ability.lower()
+    return _ABILITY_BY_ABBREVIATION.get(key, key)
+
+
+def _related_rows(character: Character, name: str, *select_related: str):
+    """
+    Return a reverse relation's rows, reusing the prefetch cache when the character
+    was loaded via get_character_for_validation and joining directly otherwise
+    """
+    manager = getattr(character, name)
+    if name in getattr(character, '_prefetched_objects_cache', {}):
+        return manager.all()
+    return manager.select_related(*select_related)
+
 
 class CharacterValidationService:
     """Service class for validating character data against D&D rules"""
@@ -65,13 +94,10 @@ class CharacterValidationService:
     @staticmethod
     def _validate_point_buy_cost(scores: Dict[str, int]) -> List[str]:
         """Validate point buy doesn't exceed 27 points"""
-        # Point buy costs: 8=0, 9=1, 10=2, 11=3, 12=4, 13=5, 14=7, 15=9
-        cost_table = {8: 0, 9: 1, 10: 2, 11: 3, 12: 4, 13: 5, 14: 7, 15: 9}
-
         total_cost = 0
         for score in scores.values():
-            if score in cost_table:
-                total_cost += cost_table[score]
+            if score in _POINT_BUY_COSTS:
+                total_cost += _POINT_BUY_COSTS[score]
             else:
                 return [f"Invalid score {score} for point buy"]
 
@@ -83,14 +109,59 @@ class CharacterValidationService:
     @staticmethod
     def _validate_standard_array(scores: Dict[str, int]) -> List[str]:
         """Validate standard array uses exactly [15, 14, 13, 12, 10, 8]"""
-        standard_scores = [15, 14, 13, 12, 10, 8]
         used_scores = sorted(scores.values(), reverse=True)
 
-        if used_scores != standard_scores:
-            return [f"Standard array must use exactly {standard_scores}, got {used_scores}"]
+        if tuple(used_scores) != _STANDARD_ARRAY:
+            return [f"Standard array must use exactly {list(_STANDARD_ARRAY)}, got {used_scores}"]
 
         return []
 
+    @staticmethod
+    def get_character_for_validation(character_id: int, user) -> Character:
+        """
+        Load a character with only the columns and relations the validators read
+
+        Raises:
+            Character.DoesNotExist: if no such character belongs to the user
+        """
+        return Character.objects.select_related(
+            'dnd_class', 'background', 'species', 'abilities'
+        ).only(
+            'id', 'character_name', 'level', 'dnd_class', 'background', 'species',
+            'abilities__strength_score', 'abilities__dexterity_score',
+            'abilities__constitution_score', 'abilities__intelligence_score',
+            'abilities__wisdom_score', 'abilities__charisma_score',
+        ).prefetch_related(
+            Prefetch('equipment', queryset=CharacterEquipment.objects.select_related(
+                'equipment', 'equipment__armor', 'equipment__weapon'
+            ).only(
+                'character_id', 'quantity', 'equipped',
+                'equipment__name', 'equipment__weight', 'equipment__properties',
+                'equipment__armor__name', 'equipment__armor__armor_type',
+                'equipment__weapon__name', 'equipment__weapon__weapon_category',
+            )),
+            # available_to_class saves validate_character_spells its availability query
+            Prefetch('spells', queryset=CharacterSpell.objects.select_related('spell').only(
+                'character_id', 'prepared', 'spell__id', 'spell__spell_level', 'spell__name'
+            ).annotate(available_to_class=Exists(
+                Spell.available_to_classes.through.objects.filter(
+                    spell_id=OuterRef('spell_id'), dndclass_id=OuterRef('character__dnd_class_id')
+                )
+            ))),
+            Prefetch('feats', queryset=CharacterFeat.objects.select_related('feat').only(
+                'character_id', 'feat_id', 'source', 'feat__name', 'feat__prerequisites'
+            )),
+        ).get(id=character_id, user=user)
+
+    @staticmethod
+    def _get_ability_scores(character: Character) -> Dict[str, int]:
+        """Build a name -> score dict once so validators avoid repeated getattr lookups"""
+        if not hasattr(character, 'abilities'):
+            return {}
+
+        abilities = character.abilities
+        return {name: getattr(abilities, f"{name}_score") for name in _ABILITY_NAMES}
+
     @classmethod
     def validate_character_skills(cls, character: Character) -> Dict[str, List[str]]:
         """
@@ -162,16 +233,13 @@ class CharacterValidationService:
         if not character.dnd_class:
             return errors
 
-        # Get equipped items
-        equipped_armor = character.equipment.filter(
-            equipped=True,
-            equipment__armor__isnull=False
-        ).select_related('equipment__armor')
-
-        equipped_weapons = character.equipment.filter(
-            equipped=True,
-            equipment__weapon__isnull=False
-        ).select_related('equipment__weapon')
+        # Fetch all carried items once; armor/weapon and encumbrance checks run in memory
+        carried = list(_related_rows(
+            character, 'equipment', 'equipment', 'equipment__armor', 'equipment__weapon'
+        ))
+        equipped = [ce for ce in carried if ce.equipped]
+        equipped_armor = [ce for ce in equipped if hasattr(ce.equipment, 'armor')]
+        equipped_weapons = [ce for ce in equipped if hasattr(ce.equipment, 'weapon')]
 
         # Validate armor proficiency
         for char_equipment in equipped_armor:
@@ -200,25 +268,23 @@ class CharacterValidationService:
                 )
 
         # Check multiple armor pieces
-        if equipped_armor.count() > 1:
+        if len(equipped_armor) > 1:
             errors['multiple_armor'] = ['Cannot wear multiple pieces of armor']
 
         # Check shield + two-handed weapon conflict
-        has_shield = character.equipment.filter(
-            equipped=True,
-            equipment__name__icontains='shield'
-        ).exists()
-
-        two_handed_weapons = equipped_weapons.filter(
-            equipment__weapon__properties__contains=['two-handed']
+        has_shield = any('shield' in ce.equipment.name.lower() for ce in equipped)
+        has_two_handed = any(
+            'two-handed' in (ce.equipment.properties or [])
+            for ce in equipped_weapons
         )
 
-        if has_shield and two_handed_weapons.exists():
+        if has_shield and has_two_handed:
             errors['shield_conflict'] = ['Cannot use shield with two-handed weapon']
 
-        # Validate encumbrance
-        from .calculation_service import CharacterCalculationService
-        encumbrance_status = CharacterCalculationService.get_encumbrance_status(character)
+        # Validate encumbrance from the rows already loaded (quantity * weight)
+        encumbrance_status = CharacterCalculationService.get_encumbrance_status(
+            character, CharacterCalculationService.calculate_current_encumbrance(character, carried)
+        )
 
         if encumbrance_status == 'overloaded':
             errors['encumbrance'] = ['Character is overloaded (exceeds carrying capacity)']
@@ -226,7 +292,8 @@ class CharacterValidationService:
         return errors
 
     @classmethod
-    def validate_character_spells(cls, character: Character) -> Dict[str, List[str]]:
+    def validate_character_spells(cls, character: Character,
+                                  ability_scores: Optional[Dict[str, int]] = None) -> Dict[str, List[str]]:
         """
         Validate character spell selections
 
@@ -247,13 +314,12 @@ class CharacterValidationService:
         if not spell_progression:
             return errors
 
-        # Count current spells by level
-        cantrips = character.spells.filter(spell__spell_level=0)
-        first_level_spells = character.spells.filter(spell__spell_level=1)
+        # Load spells once (with their Spell rows joined); counts below run in memory
+        character_spells = list(_related_rows(character, 'spells', 'spell'))
 
         # Validate cantrip count
         expected_cantrips = spell_progression.get('cantrips_known', 0)
-        actual_cantrips = cantrips.count()
+        actual_cantrips = sum(1 for cs in character_spells if cs.spell.spell_level == 0)
 
         if actual_cantrips != expected_cantrips:
             errors['cantrips'] = [
@@ -263,28 +329,35 @@ class CharacterValidationService:
         # Validate 1st level spells known (for classes that learn spells)
         if 'spells_known' in spell_progression:
             expected_spells = spell_progression['spells_known']
-            actual_spells = first_level_spells.count()
+            actual_spells = sum(1 for cs in character_spells if cs.spell.spell_level == 1)
 
             if actual_spells != expected_spells:
                 errors['spells_known'] = [
                     f"Should know {expected_spells} 1st-level spells, but has {actual_spells}"
                 ]
 
-        # Validate spell availability for class
-        class_spell_list = Spell.objects.filter(available_to_classes=character.dnd_class)
-        invalid_spells = character.spells.exclude(
-            spell__in=class_spell_list
-        ).values_list('spell__name', flat=True)
+        # Validate spell availability for class; rows from get_character_for_validation
+        # carry the answer, otherwise look the ids up in one query
+        if all(hasattr(cs, 'available_to_class') for cs in character_spells):
+            invalid_spells = [cs.spell.name for cs in character_spells if not cs.available_to_class]
+        else:
+            class_spell_ids = set(Spell.objects.filter(
+                available_to_classes=character.dnd_class,
+                id__in=[cs.spell_id for cs in character_spells]
+            ).values_list('id', flat=True))
+            invalid_spells = [
+                cs.spell.name for cs in character_spells if cs.spell_id not in class_spell_ids
+            ]
 
         if invalid_spells:
             errors['invalid_spells'] = [
-                f"Spells not available to {character.dnd_class.name}: {list(invalid_spells)}"
+                f"Spells not available to {character.dnd_class.name}: {invalid_spells}"
             ]
 
         # Validate prepared spells (for prepared casters)
         if character.dnd_class.spell_preparation == 'prepared':
-            max_prepared = cls._calculate_max_prepared_spells(character)
-            prepared_count = character.spells.filter(prepared=True).count()
+            max_prepared = cls._calculate_max_prepared_spells(character, ability_scores)
+            prepared_count = sum(1 for cs in character_spells if cs.prepared)
 
             if prepared_count > max_prepared:
                 errors['prepared_spells'] = [
@@ -293,21 +366,23 @@ class CharacterValidationService:
 
         return errors
 
-    @staticmethod
-    def _calculate_max_prepared_spells(character: Character) -> int:
+    @classmethod
+    def _calculate_max_prepared_spells(cls, character: Character,
+                                       ability_scores: Optional[Dict[str, int]] = None) -> int:
         """Calculate maximum prepared spells for prepared casters"""
-        if not hasattr(character, 'abilities'):
+        if ability_scores is None:
+            ability_scores = cls._get_ability_scores(character)
+        if not ability_scores:
             return 0
 
         spellcasting_ability = character.dnd_class.primary_ability
-        ability_modifier = (
-            getattr(character.abilities, f"{spellcasting_ability.lower()}_score") - 10
-        ) // 2
+        ability_modifier = (ability_scores[_ability_key(spellcasting_ability)] - 10) // 2
 
         return max(1, character.level + ability_modifier)
 
     @classmethod
-    def validate_character_feats(cls, character: Character) -> Dict[str, List[str]]:
+    def validate_character_feats(cls, character: Character,
+                                 ability_scores: Optional[Dict[str, int]] = None) -> Dict[str, List[str]]:
         """
         Validate character feat selections
 
@@ -318,12 +393,16 @@ class CharacterValidationService:
         """
         errors = {}
 
+        # Load feats once; all checks below run over the same (possibly prefetched) rows
+        character_feats = list(_related_rows(character, 'feats', 'feat'))
+
         # Validate origin feat (from background)
-        if character.background and character.background.origin_feat:
-            has_origin_feat = character.feats.filter(
-                feat=character.background.origin_feat,
-                source='background'
-            ).exists()
+        if character.background and character.background.origin_feat_id:
+            origin_feat_id = character.background.origin_feat_id
+            has_origin_feat = any(
+                cf.feat_id == origin_feat_id and cf.source == 'background'
+                for cf in character_feats
+            )
 
             if not has_origin_feat:
                 errors['origin_feat'] = [
@@ -331,11 +410,16 @@ class CharacterValidationService:
                 ]
 
         # Validate feat prerequisites
-        for character_feat in character.feats.all():
+        if ability_scores is None:
+            ability_scores = cls._get_ability_scores(character)
+
+        for character_feat in character_feats:
             feat = character_feat.feat
 
             if feat.prerequisites:
-                prereq_errors = cls._validate_feat_prerequisites(character, feat.prerequisites)
+                prereq_errors = cls._validate_feat_prerequisites(
+                    character, feat.prerequisites, ability_scores
+                )
                 if prereq_errors:
                     errors.setdefault('feat_prerequisites', []).extend(prereq_errors)
 
@@ -344,7 +428,7 @@ class CharacterValidationService:
         available_asi = sum(1 for level in asi_levels if level <= character.level)
 
         # Count non-origin feats (ASI choices)
-        asi_feats = character.feats.exclude(source='background').count()
+        asi_feats = sum(1 for cf in character_feats if cf.source != 'background')
 
         # This is a soft validation - character might have used ASI for ability scores instead
         if asi_feats > available_asi:
@@ -354,18 +438,21 @@ class CharacterValidationService:
 
         return errors
 
-    @staticmethod
-    def _validate_feat_prerequisites(character: Character, prerequisites: Dict) -> List[str]:
+    @classmethod
+    def _validate_feat_prerequisites(cls, character: Character, prerequisites: Dict,
+                                     ability_scores: Optional[Dict[str, int]] = None) -> List[str]:
         """Validate feat prerequisites are met"""
         errors = []
 
-        if not hasattr(character, 'abilities'):
+        if ability_scores is None:
+            ability_scores = cls._get_ability_scores(character)
+        if not ability_scores:
             return ["Character abilities not set"]
 
         # Check ability score prerequisites
         if 'abilities' in prerequisites:
             for ability, min_score in prerequisites['abilities'].items():
-                actual_score = getattr(character.abilities, f"{ability.lower()}_score")
+                actual_score = ability_scores.get(_ability_key(ability), 0)
                 if actual_score < min_score:
                     errors.append(
                         f"Requires {ability.upper()} {min_score}, but has {actual_score}"
@@ -388,23 +475,21 @@ class CharacterValidationService:
         return errors
 
     @staticmethod
-    def _get_asi_levels_for_class(dnd_class) -> List[int]:
+    def _get_asi_levels_for_class(dnd_class) -> Tuple[int, ...]:
         """Get levels where class gets Ability Score Improvements"""
         if not dnd_class:
-            return []
-
-        # Standard ASI levels for most classes
-        standard_asi = [4, 8, 12, 16, 19]
+            return ()
 
         # Fighter gets extra ASIs
         if dnd_class.name == 'Fighter':
-            return [4, 6, 8, 12, 14, 16, 19]
+            return _ASI_FIGHTER
 
         # Rogue gets extra ASI
         if dnd_class.name == 'Rogue':
-            return [4, 8, 10, 12, 16, 19]
+            return _ASI_ROGUE
 
-        return standard_asi
+        # Standard ASI levels for most classes
+        return _ASI_STANDARD
 
     @classmethod
     def validate_complete_character(cls, character: Character) -> Dict[str, List[str]]:
@@ -432,16 +517,8 @@ class CharacterValidationService:
             all_errors['abilities'] = ['Character ability scores are required']
 
         # Run specific validation checks
-        if hasattr(character, 'abilities'):
-            ability_scores = {
-                'strength': character.abilities.strength_score,
-                'dexterity': character.abilities.dexterity_score,
-                'constitution': character.abilities.constitution_score,
-                'intelligence': character.abilities.intelligence_score,
-                'wisdom': character.abilities.wisdom_score,
-                'charisma': character.abilities.charisma_score,
-            }
-
+        ability_scores = cls._get_ability_scores(character)
+        if ability_scores:
             ability_errors = cls.validate_ability_scores(ability_scores, 'roll')
             if ability_errors:
                 all_errors.update(ability_errors)
@@ -454,11 +531,11 @@ class CharacterValidationService:
         if equipment_errors:
             all_errors.update(equipment_errors)
 
-        spell_errors = cls.validate_character_spells(character)
+        spell_errors = cls.validate_character_spells(character, ability_scores)
         if spell_errors:
             all_errors.update(spell_errors)
 
-        feat_errors = cls.validate_character_feats(character)
+        feat_errors = cls.validate_character_feats(character, ability_scores)
         if feat_errors:
             all_errors.update(feat_errors)
 
@@ -485,9 +562,11 @@ class CharacterValidationService:
         if not character.dnd_class or not hasattr(character, 'abilities'):
             return warnings
 
+        ability_scores = cls._get_ability_scores(character)
+
         # Check if primary ability is optimized
         primary_ability = character.dnd_class.primary_ability
-        primary_score = getattr(character.abilities, f"{primary_ability.lower()}_score")
+        primary_score = ability_scores[_ability_key(primary_ability)]
 
         if primary_score < 14:
             warnings['suboptimal_primary'] = [
@@ -496,7 +575,7 @@ class CharacterValidationService:
             ]
 
         # Check for very low Constitution
-        con_score = character.abilities.constitution_score
+        con_score = ability_scores['constitution']
         if con_score < 12:
             warnings['low_constitution'] = [
                 f"Constitution of {con_score} is quite low. Consider higher CON for survivability."
@@ -506,7 +585,9 @@ class CharacterValidationService:
         if character.level >= 4:
             asi_levels = cls._get_asi_levels_for_class(character.dnd_class)
             available_asi = sum(1 for level in asi_levels if level <= character.level)
-            used_asi = character.feats.exclude(source='background').count()
+            used_asi = sum(
+                1 for cf in _related_rows(character, 'feats') if cf.source != 'background'
+            )
 
             # Assume remaining ASI used for ability scores, but warn if none used for feats
             if used_asi == 0 and available_asi > 0:
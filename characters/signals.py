@@ -0,0 +1,47 @@
+"""
+Signal handlers for the characters app
+"""
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from game_content.models import DnDClass
+from .models import (
+    Character, CharacterAbilities, CharacterSkill, CharacterSavingThrow,
+    CharacterProficiency, CharacterEquipment, CharacterSpell,
+    CharacterFeature, CharacterFeat, CharacterLanguage, CharacterDetails
+)
+from .services.recommendation_service import RecommendationService
+
+
+@receiver([post_save, post_delete], sender=DnDClass)
+def invalidate_build_recommendations(sender, instance, **kwargs):
+    """Drop the cached class lookup and build recommendations when a class changes"""
+    cache.delete_many([
+        RecommendationService.dnd_class_cache_key(instance.name),
+        RecommendationService.BUILD_RECOMMENDATIONS_CACHE_KEY.format(class_id=instance.pk),
+    ])
+
+
+CHARACTER_CHILD_MODELS = (
+    CharacterAbilities, CharacterSkill, CharacterSavingThrow, CharacterProficiency,
+    CharacterEquipment, CharacterSpell, CharacterFeature, CharacterFeat,
+    CharacterLanguage, CharacterDetails,
+)
+
+
+def touch_character(sender, instance, **kwargs):
+    """
+    Bump the owning character's last_modified_date when one of its rows changes, so the
+    sheet/calculate_stats ETag and stats cache key (both built from it) move on
+    """
+    # Rows removed by a cascade from the character itself have nothing left to bump
+    if isinstance(kwargs.get('origin'), Character):
+        return
+    Character.objects.filter(pk=instance.character_id).update(last_modified_date=timezone.now())
+
+
+for _model in CHARACTER_CHILD_MODELS:
+    post_save.connect(touch_character, sender=_model, dispatch_uid=f'touch_character_{_model.__name__}')
+    post_delete.connect(touch_character, sender=_model, dispatch_uid=f'touch_character_delete_{_model.__name__}')
@@ -1,3 +1,283 @@
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from nplusone.core import profiler
 
-# Create your tests here.
+from game_content.models import Armor, Background, DnDClass, Equipment, Feat, Species, Spell, Weapon
+from users.models import User
+
+from .models import (
+    Character, CharacterAbilities, CharacterDetails, CharacterEquipment, CharacterFeat,
+    CharacterSpell
+)
+from .services import CharacterValidationService
+
+
+class ValidationQueryBudgetTests(TestCase):
+    """Lock in the validation service's query counts so N+1 regressions fail CI"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='budget', email='budget@example.com')
+        dnd_class = DnDClass.objects.create(
+            name='Fighter', description='', primary_ability='STR',
+            armor_proficiencies=['light', 'medium'], weapon_proficiencies=['simple']
+        )
+        origin_feat = Feat.objects.create(name='Alert', feat_type='origin', description='')
+        general_feat = Feat.objects.create(
+            name='Great Weapon Master', feat_type='general', description='',
+            prerequisites={'abilities': {'STR': 13}}
+        )
+        background = Background.objects.create(name='Soldier', description='', origin_feat=origin_feat)
+        species = Species.objects.create(name='Dwarf', description='')
+
+        cls.character = Character.objects.create(
+            user=cls.user, character_name='Budget', level=5,
+            dnd_class=dnd_class, background=background, species=species
+        )
+        CharacterAbilities.objects.create(character=cls.character, strength_score=12)
+
+        items = [
+            Weapon.objects.create(
+                name='Greatsword', equipment_type='weapon', weapon_category='martial',
+                damage_dice='2d6', damage_type='slashing', properties=['two-handed']
+            ),
+            Armor.objects.create(name='Plate', equipment_type='armor', armor_type='heavy', base_ac=18),
+            Armor.objects.create(name='Shield', equipment_type='shield', armor_type='shield', base_ac=2),
+            Equipment.objects.create(name='Rope', equipment_type='gear', weight=10),
+        ]
+        for item in items:
+            CharacterEquipment.objects.create(
+                character=cls.character, equipment=item, equipped=item.equipment_type != 'gear'
+            )
+
+        spell = Spell.objects.create(
+            name='Fire Bolt', spell_level=0, school='evocation', casting_time='action',
+            range='120_feet', duration='instantaneous', description=''
+        )
+        CharacterSpell.objects.create(character=cls.character, spell=spell)
+        CharacterFeat.objects.create(character=cls.character, feat=origin_feat, source='background')
+        CharacterFeat.objects.create(character=cls.character, feat=general_feat, source='asi')
+
+    def load_character(self):
+        return CharacterValidationService.get_character_for_validation(self.character.id, self.user)
+
+    def assertQueryBudget(self, budget, func, *args):
+        """Run func under the N+1 profiler and fail if it issues more than budget queries"""
+        # The shared validation loader eager-loads relations for every validator, so only
+        # lazy loads are treated as errors here
+        whitelist = [{'label': 'unused_eager_load'}]
+        with profiler.Profiler(whitelist), CaptureQueriesContext(connection) as ctx:
+            result = func(*args)
+
+        self.assertLessEqual(
+            len(ctx.captured_queries), budget,
+            f"{func.__name__} issued {len(ctx.captured_queries)} queries (budget {budget})"
+        )
+        return result
+
+    def test_get_character_for_validation(self):
+        # Character + abilities/class/background/species join, then equipment, spells, feats
+        with CaptureQueriesContext(connection) as ctx:
+            self.load_character()
+
+        self.assertLessEqual(len(ctx.captured_queries), 4)
+
+    def test_validate_character_equipment(self):
+        character = self.load_character()
+
+        # Encumbrance is summed from the prefetched rows too
+        errors = self.assertQueryBudget(
+            0, CharacterValidationService.validate_character_equipment, character
+        )
+        self.assertIn('shield_conflict', errors)
+
+    def load_caster(self):
+        """
+        Load the character with its class posing as a prepared caster. DnDClass has no
+        spellcasting columns yet, so they're supplied on the loaded instance.
+        """
+        character = self.load_character()
+        character.dnd_class.spellcaster = True
+        character.dnd_class.spell_preparation = 'prepared'
+        character.dnd_class.get_spell_progression = lambda level: {'cantrips_known': 1}
+        return character
+
+    def test_validate_character_spells(self):
+        errors = self.assertQueryBudget(
+            0, CharacterValidationService.validate_character_spells, self.load_caster()
+        )
+        self.assertEqual(errors, {'invalid_spells': ["Spells not available to Fighter: ['Fire Bolt']"]})
+
+        Spell.objects.get(name='Fire Bolt').available_to_classes.add(self.character.dnd_class)
+        errors = self.assertQueryBudget(
+            0, CharacterValidationService.validate_character_spells, self.load_caster()
+        )
+        self.assertEqual(errors, {})
+
+    def test_validate_character_feats(self):
+        character = self.load_character()
+
+        errors = self.assertQueryBudget(
+            0, CharacterValidationService.validate_character_feats, character
+        )
+        self.assertEqual(errors['feat_prerequisites'], ['Requires STR 13, but has 12'])
+
+    def test_get_character_warnings(self):
+        character = self.load_character()
+
+        warnings = self.assertQueryBudget(
+            0, CharacterValidationService.get_character_warnings, character
+        )
+        self.assertIn('suboptimal_primary', warnings)
+
+
+class CharacterApiTests(TestCase):
+    """Conditional GETs, cached stats and the step update endpoints of CharacterViewSet"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='owner', email='owner@example.com')
+        cls.other_user = User.objects.create(username='other', email='other@example.com')
+        cls.dnd_class = DnDClass.objects.create(
+            name='Fighter', description='', primary_ability='STR', hit_die=10
+        )
+        cls.character = Character.objects.create(
+            user=cls.user, character_name='Tordek', level=3, alignment='LG',
+            dnd_class=cls.dnd_class
+        )
+        CharacterAbilities.objects.create(character=cls.character, strength_score=10)
+        cls.other_character = Character.objects.create(user=cls.other_user, character_name='Mialee')
+
+    def setUp(self):
+        # Stats and validation results are cached per character version
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def url(self, character_id, suffix=''):
+        return f'/api/characters/{character_id}/{suffix}'
+
+    def patch(self, character_id, suffix, data):
+        return self.client.patch(self.url(character_id, suffix), data, content_type='application/json')
+
+    def test_matching_etag_returns_304(self):
+        for suffix in ('', 'sheet/', 'calculate_stats/'):
+            with self.subTest(suffix=suffix):
+                response = self.client.get(self.url(self.character.pk, suffix))
+                self.assertEqual(response.status_code, 200)
+                etag = response['ETag']
+
+                response = self.client.get(self.url(self.character.pk, suffix), HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response['ETag'], etag)
+
+                response = self.client.get(
+                    self.url(self.character.pk, suffix), HTTP_IF_NONE_MATCH='W/"stale"'
+                )
+                self.assertEqual(response.status_code, 200)
+
+    def test_etag_ignores_pk_spelling(self):
+        etag = self.client.get(self.url(self.character.pk))['ETag']
+
+        response = self.client.get(self.url(f'0{self.character.pk}'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_ability_score_update_invalidates_cached_stats(self):
+        response = self.client.get(self.url(self.character.pk, 'calculate_stats/'))
+        self.assertEqual(response.json()['ability_modifiers']['strength'], 0)
+        etag = response['ETag']
+
+        response = self.patch(self.character.pk, 'ability-scores/', {'strength_score': 16})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['updated'], {'strength_score': 16})
+
+        # The old ETag no longer matches, and the stats are recalculated, not served stale
+        response = self.client.get(
+            self.url(self.character.pk, 'calculate_stats/'), HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.json()['ability_modifiers']['strength'], 3)
+
+    def test_ability_score_update_creating_abilities_returns_current_version(self):
+        character = Character.objects.create(user=self.user, character_name='Lidda')
+
+        response = self.patch(character.pk, 'ability-scores/', {'dexterity_score': 15})
+        self.assertEqual(response.status_code, 200)
+
+        # The returned ETag is the version the abilities insert left behind
+        response = self.client.get(self.url(character.pk), HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_step_update_writes_validated_values(self):
+        response = self.patch(self.character.pk, 'class/', {'dnd_class': str(self.dnd_class.pk)})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['updated'], {'dnd_class_id': self.dnd_class.pk})
+
+        response = self.patch(self.character.pk, 'alignment/', {'alignment': 'CN'})
+        self.assertEqual(response.status_code, 200)
+        self.character.refresh_from_db()
+        self.assertEqual(self.character.alignment, 'CN')
+
+    def test_invalid_values_return_400(self):
+        for suffix, data in (
+            ('class/', {'dnd_class': 'abc'}),
+            ('class/', {'dnd_class': 999999}),
+            ('alignment/', {'alignment': 'XX'}),
+            ('ability-scores/', {'strength_score': 30}),
+        ):
+            with self.subTest(suffix=suffix, data=data):
+                response = self.patch(self.character.pk, suffix, data)
+                self.assertEqual(response.status_code, 400)
+
+    def test_other_users_character_returns_404(self):
+        for suffix, data in (
+            ('class/', {'dnd_class': self.dnd_class.pk}),
+            ('alignment/', {'alignment': 'CN'}),
+            ('ability-scores/', {'strength_score': 12}),
+        ):
+            with self.subTest(suffix=suffix):
+                response = self.patch(self.other_character.pk, suffix, data)
+                self.assertEqual(response.status_code, 404)
+
+        self.other_character.refresh_from_db()
+        self.assertEqual(self.other_character.alignment, '')
+        self.assertFalse(CharacterAbilities.objects.filter(character=self.other_character).exists())
+        self.assertEqual(self.patch('abc', 'class/', {}).status_code, 404)
+
+    def test_duplicate_payload(self):
+        CharacterDetails.objects.create(character=self.character, age='40')
+
+        response = self.client.post(self.url(self.character.pk, 'duplicate/'))
+        self.assertEqual(response.status_code, 201)
+        data = response.json()
+
+        self.assertNotEqual(data['id'], self.character.pk)
+        self.assertEqual(data['character_name'], 'Tordek (Copy)')
+        self.assertEqual(data['character_state'], 'draft')
+        self.assertEqual(data['dnd_class']['name'], 'Fighter')
+        self.assertEqual(data['abilities']['strength_score'], 10)
+        self.assertIsNone(data['details'])
+        self.assertEqual(data['skills'], [])
+        # Same payload a fresh read of the copy returns
+        self.assertEqual(data, self.client.get(self.url(data['id'])).json())
+
+    def test_list_is_cursor_paginated(self):
+        Character.objects.bulk_create([
+            Character(user=self.user, character_name=f'Extra {i}') for i in range(24)
+        ])
+
+        response = self.client.get('/api/characters/')
+        self.assertEqual(response.status_code, 200)
+        first_page = response.json()
+        self.assertNotIn('count', first_page)
+        self.assertIn('cursor=', first_page['next'])
+
+        second_page = self.client.get(first_page['next']).json()
+        self.assertIsNone(second_page['next'])
+
+        ids = [row['id'] for row in first_page['results'] + second_page['results']]
+        self.assertEqual(len(ids), 25)
+        self.assertEqual(len(set(ids)), 25)
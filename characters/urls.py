@@ -1,17 +1,11 @@
 """
 Character app URLs
 """
+from django.conf import settings
 from django.urls import path, include
-# from rest_framework.routers import DefaultRouter
 
-# from . import viewsets
-# from . import utility_views
 from . import frontend_views
 
-# Create router and register viewsets - temporarily disabled
-# router = DefaultRouter()
-# router.register(r'characters', viewsets.CharacterViewSet, basename='character')
-
 # Frontend URLs (HTML views)
 frontend_patterns = [
     # Character list and management
@@ -29,33 +23,46 @@ frontend_patterns = [
     path('<int:character_id>/sheet/', frontend_views.character_sheet_view, name='character_sheet'),
 ]
 
-# Utility endpoints (API) - temporarily disabled
-# utility_patterns = [
-#     # Dice rolling endpoints
-#     path('dice/roll/', utility_views.roll_dice, name='utility_roll_dice'),
-#     path('dice/ability-scores/', utility_views.roll_ability_scores, name='utility_roll_ability_scores'),
-#     path('dice/advantage/', utility_views.roll_with_advantage, name='utility_roll_advantage'),
-#
-#     # Validation endpoints
-#     path('validate/character/<int:character_id>/', utility_views.validate_character, name='utility_validate_character'),
-#     path('validate/dice/', utility_views.validate_dice_notation, name='utility_validate_dice'),
-#
-#     # Recommendation endpoints
-#     path('recommendations/classes/', utility_views.get_class_recommendations, name='utility_class_recommendations'),
-#     path('recommendations/build/<str:class_name>/', utility_views.get_build_recommendations, name='utility_build_recommendations'),
-#
-#     # Analysis endpoints
-#     path('analyze/character/<int:character_id>/', utility_views.analyze_character_build, name='utility_analyze_character'),
-#
-#     # Generation endpoints
-#     path('generate/name/', utility_views.generate_character_name, name='utility_generate_name'),
-# ]
-
 urlpatterns = [
     # Frontend URLs (serve HTML)
     path('', include(frontend_patterns)),
+]
+
+# API endpoints - opt-in via settings.CHARACTERS_API_ENABLED. The DRF router, viewsets
+# and utility views are only imported when enabled so the frontend doesn't load them.
+if settings.CHARACTERS_API_ENABLED:
+    from rest_framework.routers import SimpleRouter
+
+    from . import utility_views
+    from . import viewsets
+
+    # core/urls.py already registers CharacterViewSet as 'character'; a distinct basename
+    # keeps reverse('character-detail') pointing at /api/ whatever the include order
+    router = SimpleRouter()
+    router.register(r'characters', viewsets.CharacterViewSet, basename='character-app')
+
+    utility_patterns = [
+        # Dice rolling endpoints
+        path('dice/roll/', utility_views.roll_dice, name='utility_roll_dice'),
+        path('dice/ability-scores/', utility_views.roll_ability_scores, name='utility_roll_ability_scores'),
+        path('dice/advantage/', utility_views.roll_with_advantage, name='utility_roll_advantage'),
+
+        # Validation endpoints
+        path('validate/character/<int:character_id>/', utility_views.validate_character, name='utility_validate_character'),
+        path('validate/dice/', utility_views.validate_dice_notation, name='utility_validate_dice'),
+
+        # Recommendation endpoints
+        path('recommendations/classes/', utility_views.get_class_recommendations, name='utility_class_recommendations'),
+        path('recommendations/build/<str:class_name>/', utility_views.get_build_recommendations, name='utility_build_recommendations'),
+
+        # Analysis endpoints
+        path('analyze/character/<int:character_id>/', utility_views.analyze_character_build, name='utility_analyze_character'),
+
+        # Generation endpoints
+        path('generate/name/', utility_views.generate_character_name, name='utility_generate_name'),
+    ]
 
-    # API endpoints - temporarily disabled
-    # path('api/', include(router.urls)),
-    # path('api/utility/', include(utility_patterns)),
-]
\ No newline at end of file
+    urlpatterns += [
+        path('api/', include(router.urls)),
+        path('api/utility/', include(utility_patterns)),
+    ]
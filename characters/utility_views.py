@@ -8,11 +8,13 @@ Provides utility endpoints for:
 - Name generation
 - Build analysis
 """
+import orjson
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
-from django.shortcuts import get_object_or_404
+from django.core.cache import cache
+from django.http import HttpResponse
 
 from .models import Character
 from .services import (
@@ -24,6 +26,19 @@ from .services import (
 )
 
 
+def json_ok(data, status=status.HTTP_200_OK):
+    """
+    Return pre-serialized JSON for endpoints that only build dicts of primitives,
+    skipping DRF's content negotiation and renderer pipeline
+    """
+    return HttpResponse(orjson.dumps(data), status=status, content_type='application/json')
+
+
+def json_err(message, status):
+    """Return a pre-serialized {"error": message} response"""
+    return json_ok({'error': message}, status=status)
+
+
 @api_view(['POST'])
 @permission_classes([AllowAny])  # Allow anonymous dice rolling
 def roll_dice(request):
@@ -49,27 +64,17 @@ def roll_dice(request):
     description = request.data.get('description', '')
 
     if not notation:
-        return Response(
-            {'error': 'Dice notation is required'},
-            status=status.HTTP_400_BAD_REQUEST
-        )
+        return json_err('Dice notation is required', status.HTTP_400_BAD_REQUEST)
 
     try:
-        # Validate notation first
-        if not DiceRollerService.validate_dice_notation(notation):
-            return Response(
-                {'error': f'Invalid dice notation: {notation}'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        # Roll the dice
+        # Roll the dice - parsing raises ValueError for invalid notation
         result = DiceRollerService.parse_dice_notation(notation)
 
         # Override description if provided
         if description:
             result.description = description
 
-        return Response({
+        return json_ok({
             'dice_count': result.dice_count,
             'dice_size': result.dice_size,
             'modifier': result.modifier,
@@ -79,10 +84,7 @@ def roll_dice(request):
         })
 
     except ValueError as e:
-        return Response(
-            {'error': str(e)},
-            status=status.HTTP_400_BAD_REQUEST
-        )
+        return json_err(str(e), status.HTTP_400_BAD_REQUEST)
 
 
 @api_view(['POST'])
@@ -116,16 +118,10 @@ def roll_ability_scores(request):
     count = request.data.get('count', 6)
 
     if method != 'roll':
-        return Response(
-            {'error': 'Only "roll" method supported for this endpoint'},
-            status=status.HTTP_400_BAD_REQUEST
-        )
+        return json_err('Only "roll" method supported for this endpoint', status.HTTP_400_BAD_REQUEST)
 
     if not isinstance(count, int) or count < 1 or count > 6:
-        return Response(
-            {'error': 'Count must be between 1 and 6'},
-            status=status.HTTP_400_BAD_REQUEST
-        )
+        return json_err('Count must be between 1 and 6', status.HTTP_400_BAD_REQUEST)
 
     try:
         # Roll ability scores
@@ -154,17 +150,14 @@ def roll_ability_scores(request):
             'lowest': min(totals)
         }
 
-        return Response({
+        return json_ok({
             'method': method,
             'scores': scores_response,
             'statistics': statistics
         })
 
     except Exception as e:
-        return Response(
-            {'error': str(e)},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
+        return json_err(str(e), status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 @api_view(['POST'])
@@ -193,9 +186,9 @@ def roll_with_advantage(request):
     description = request.data.get('description', 'Roll')
 
     if advantage_type not in ['advantage', 'disadvantage', 'normal']:
-        return Response(
-            {'error': 'advantage_type must be "advantage", "disadvantage", or "normal"'},
-            status=status.HTTP_400_BAD_REQUEST
+        return json_err(
+            'advantage_type must be "advantage", "disadvantage", or "normal"',
+            status.HTTP_400_BAD_REQUEST
         )
 
     try:
@@ -209,7 +202,7 @@ def roll_with_advantage(request):
         if description != 'Roll':
             result.description = f"{description} ({result.description})"
 
-        return Response({
+        return json_ok({
             'roll1': result.roll1,
             'roll2': result.roll2,
             'result': result.result,
@@ -218,10 +211,7 @@ def roll_with_advantage(request):
         })
 
     except Exception as e:
-        return Response(
-            {'error': str(e)},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
+        return json_err(str(e), status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 @api_view(['POST'])
@@ -239,10 +229,8 @@ def validate_character(request, character_id):
     }
     """
     try:
-        character = get_object_or_404(
-            Character.objects.select_related('dnd_class', 'species', 'background', 'abilities'),
-            id=character_id,
-            user=request.user
+        character = CharacterValidationService.get_character_for_validation(
+            character_id, request.user
         )
 
         # Run full validation
@@ -344,42 +332,55 @@ def get_build_recommendations(request, class_name):
         "spell_recommendations": [...]  # for spellcasters
     }
     """
+    from game_content.models import DnDClass
+
     try:
+        try:
+            dnd_class = RecommendationService.get_dnd_class(class_name)
+        except DnDClass.DoesNotExist:
+            dnd_class = None
+
+        # Recommendations are a pure function of the class, cached per class until it
+        # changes; names that don't resolve to a class are answered but never cached
+        cache_key = None
+        if dnd_class:
+            class_name = dnd_class.name
+            cache_key = RecommendationService.BUILD_RECOMMENDATIONS_CACHE_KEY.format(class_id=dnd_class.pk)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return json_ok(cached)
+
         background_recs = RecommendationService.recommend_background_for_class(class_name)
         species_recs = RecommendationService.recommend_species_for_class(class_name)
         ability_priorities = RecommendationService.recommend_ability_score_priority(class_name)
 
         # Create a dummy character to get feat recommendations
-        from .models import Character
-        from game_content.models import DnDClass
-
-        try:
-            dnd_class = DnDClass.objects.get(name=class_name)
+        feat_recs = []
+        if dnd_class:
             dummy_character = Character(dnd_class=dnd_class, level=1)
             feat_recs = RecommendationService.recommend_feats_for_build(dummy_character)
-        except DnDClass.DoesNotExist:
-            feat_recs = []
 
-        # Get spell recommendations for spellcasters
+        # Get spell recommendations - non-casters have no entries and get an empty list
         spell_recs = []
-        if dnd_class and dnd_class.spellcaster:
+        if dnd_class:
             spell_recs = RecommendationService.recommend_spells_for_class(class_name, 1, 0)  # Cantrips
             spell_recs.extend(RecommendationService.recommend_spells_for_class(class_name, 1, 1))  # 1st level
 
-        return Response({
+        data = {
             'class_name': class_name,
             'background_recommendations': background_recs,
             'species_recommendations': species_recs,
             'ability_priorities': ability_priorities,
             'feat_recommendations': feat_recs,
             'spell_recommendations': spell_recs
-        })
+        }
+        if cache_key:
+            cache.set(cache_key, data, RecommendationService.BUILD_RECOMMENDATIONS_CACHE_TTL)
+
+        return json_ok(data)
 
     except Exception as e:
-        return Response(
-            {'error': str(e)},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
+        return json_err(str(e), status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 @api_view(['POST'])
@@ -397,53 +398,9 @@ def analyze_character_build(request, character_id):
     }
     """
     try:
-        character = get_object_or_404(
-            Character.objects.select_related('dnd_class', 'species', 'background', 'abilities'),
-            id=character_id,
-            user=request.user
-        )
+        character = RecommendationService.get_character_for_analysis(character_id, request.user)
 
-        # Get optimization score
-        optimization = RecommendationService.get_build_optimization_score(character)
-
-        # Get synergy analysis
-        synergies = RecommendationService.analyze_character_synergies(character)
-
-        # Get ability score assignment recommendations
-        suggestions = []
-        if hasattr(character, 'abilities'):
-            current_scores = [
-                character.abilities.strength_score,
-                character.abilities.dexterity_score,
-                character.abilities.constitution_score,
-                character.abilities.intelligence_score,
-                character.abilities.wisdom_score,
-                character.abilities.charisma_score
-            ]
-
-            optimal_assignment = RecommendationService.recommend_ability_score_assignment(
-                character.dnd_class.name, current_scores
-            )
-
-            suggestions.append({
-                'type': 'ability_scores',
-                'current_assignment': {
-                    'strength': character.abilities.strength_score,
-                    'dexterity': character.abilities.dexterity_score,
-                    'constitution': character.abilities.constitution_score,
-                    'intelligence': character.abilities.intelligence_score,
-                    'wisdom': character.abilities.wisdom_score,
-                    'charisma': character.abilities.charisma_score
-                },
-                'optimal_assignment': optimal_assignment
-            })
-
-        return Response({
-            'optimization_score': optimization,
-            'synergy_analysis': synergies,
-            'suggestions': suggestions,
-            'character_name': character.character_name or 'Unnamed Character'
-        })
+        return Response(RecommendationService.analyze_character_build(character))
 
     except Character.DoesNotExist:
         return Response(
@@ -481,18 +438,12 @@ def generate_character_name(request):
     count = request.data.get('count', 1)
 
     if not isinstance(count, int) or count < 1 or count > 10:
-        return Response(
-            {'error': 'count must be between 1 and 10'},
-            status=status.HTTP_400_BAD_REQUEST
-        )
+        return json_err('count must be between 1 and 10', status.HTTP_400_BAD_REQUEST)
 
     try:
-        names = []
-        for _ in range(count):
-            name = DiceRollerService.generate_character_name(species, gender)
-            names.append(name)
+        names = DiceRollerService.generate_character_names(species, gender, count)
 
-        return Response({
+        return json_ok({
             'names': names,
             'species': species,
             'gender': gender,
@@ -500,10 +451,7 @@ def generate_character_name(request):
         })
 
     except Exception as e:
-        return Response(
-            {'error': str(e)},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
+        return json_err(str(e), status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 @api_view(['POST'])
@@ -525,21 +473,15 @@ def validate_dice_notation(request):
     notation = request.data.get('notation')
 
     if not notation:
-        return Response(
-            {'error': 'Dice notation is required'},
-            status=status.HTTP_400_BAD_REQUEST
-        )
+        return json_err('Dice notation is required', status.HTTP_400_BAD_REQUEST)
 
     try:
         is_valid = DiceRollerService.validate_dice_notation(notation)
 
-        return Response({
+        return json_ok({
             'valid': is_valid,
             'notation': notation
         })
 
     except Exception as e:
-        return Response(
-            {'error': str(e)},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
\ No newline at end of file
+        return json_err(str(e), status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
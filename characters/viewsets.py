@@ -1,25 +1,242 @@
 """
 Character ViewSets for D&D Character Creator API
 """
+import threading
+
 from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
 from django.db.models import Prefetch
+from django.utils import timezone
+from django.utils.http import http_date, parse_http_date_safe
+
+from core.pagination import LastModifiedCursorPagination
 
-from .models import Character
+from .filters import CharacterFilter
+from .models import (
+    Character, CharacterAbilities, CharacterEquipment, CharacterFeat, CharacterLanguage,
+    CharacterProficiency, CharacterSavingThrow, CharacterSkill, CharacterSpell
+)
 from .serializers import (
     CharacterListSerializer,
     CharacterDetailSerializer,
     CharacterCreateSerializer,
     CharacterAbilitiesUpdateSerializer,
-    CharacterDetailsUpdateSerializer
+    CharacterDetailsUpdateSerializer,
+    CharacterStepUpdateSerializer
 )
 from .services.calculation_service import CharacterCalculationService
 from .services.dice_service import DiceRollerService
 from .services import CharacterValidationService
 
 
+_ABILITY_NAMES = ('strength', 'dexterity', 'constitution', 'intelligence', 'wisdom', 'charisma')
+
+_DETAILS_FIELDS = (
+    'age', 'height', 'weight', 'eyes', 'skin', 'hair', 'pronouns',
+    'portrait_url', 'personality_traits', 'ideals', 'bonds', 'flaws',
+    'backstory', 'notes'
+)
+
+# Child collections in the detail payload, all empty on a freshly duplicated character
+_CHILD_COLLECTIONS = (
+    'skills', 'saving_throws', 'proficiencies', 'equipment', 'spells', 'feats', 'languages'
+)
+
+# In-flight stats calculations by cache key, for _single_flight
+_inflight_lock = threading.Lock()
+_inflight = {}
+
+
+class _Flight:
+    """One in-progress computation that other threads can wait on"""
+    __slots__ = ('done', 'result')
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+def _single_flight(key, compute):
+    """
+    Run compute() once per key across this process's threads: callers arriving while
+    it runs wait and share the result. If it raises, each waiter computes for itself.
+    """
+    with _inflight_lock:
+        flight = _inflight.get(key)
+        leader = flight is None
+        if leader:
+            flight = _inflight[key] = _Flight()
+
+    if not leader:
+        flight.done.wait()
+        try:
+            return flight.result
+        except AttributeError:
+            return compute()
+
+    try:
+        flight.result = compute()
+        return flight.result
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+        flight.done.set()
+
+
+def _related_or_none(character, name):
+    """Return a one-to-one related row, or None when it doesn't exist"""
+    try:
+        return getattr(character, name)
+    except ObjectDoesNotExist:
+        return None
+
+
+def _character_to_dict(character, with_relations=True):
+    """
+    Build CharacterDetailSerializer's payload directly from a loaded character, without
+    constructing and deep-copying serializer fields. Used by the read-heavy actions;
+    keep in step with CharacterDetailSerializer.Meta.fields.
+
+    Pass with_relations=False for a character known to have no details or child rows
+    yet (a fresh duplicate), to render them empty without querying.
+    """
+    dnd_class = character.dnd_class
+    species = character.species
+    background = character.background
+    abilities = _related_or_none(character, 'abilities')
+
+    abilities_data = None
+    if abilities is not None:
+        scores = [getattr(abilities, f"{name}_score") for name in _ABILITY_NAMES]
+        abilities_data = {f"{name}_score": score for name, score in zip(_ABILITY_NAMES, scores)}
+        abilities_data.update({
+            f"{name}_modifier": abilities.modifier(score) for name, score in zip(_ABILITY_NAMES, scores)
+        })
+
+    data = {
+        'id': character.id,
+        'character_name': character.character_name,
+        'level': character.level,
+        'level_display': character.level_display,
+        'experience_points': character.experience_points,
+        'alignment': character.alignment,
+        'dnd_class': {
+            'id': dnd_class.id,
+            'name': dnd_class.name,
+            'primary_ability': dnd_class.primary_ability,
+            'hit_die': dnd_class.hit_die,
+        } if dnd_class is not None else None,
+        'subclass': character.subclass_id,
+        'species': {
+            'id': species.id,
+            'name': species.name,
+            'size': species.size,
+            'speed': species.speed,
+        } if species is not None else None,
+        'background': {
+            'id': background.id,
+            'name': background.name,
+        } if background is not None else None,
+        'current_hp': character.current_hp,
+        'max_hp': character.max_hp,
+        'temporary_hp': character.temporary_hp,
+        'armor_class': character.armor_class,
+        'initiative': character.initiative,
+        'speed': character.speed,
+        'proficiency_bonus': character.proficiency_bonus,
+        'inspiration': character.inspiration,
+        'character_state': character.character_state,
+        'is_complete': character.is_complete,
+        'additional_notes': character.additional_notes,
+        'created_date': character.created_date,
+        'last_modified_date': character.last_modified_date,
+        'abilities': abilities_data,
+    }
+
+    if not with_relations:
+        data['details'] = None
+        data.update({name: [] for name in _CHILD_COLLECTIONS})
+        return data
+
+    details = _related_or_none(character, 'details')
+    data.update({
+        'details': {
+            name: getattr(details, name) for name in _DETAILS_FIELDS
+        } if details is not None else None,
+        'skills': [
+            {
+                'skill': {
+                    'id': cs.skill.id,
+                    'name': cs.skill.name,
+                    'associated_ability': cs.skill.associated_ability,
+                },
+                'proficiency_type': cs.proficiency_type,
+                'bonus': cs.bonus,
+            }
+            for cs in character.skills.all()
+        ],
+        'saving_throws': [
+            {
+                'ability_name': st.ability_name,
+                'is_proficient': st.is_proficient,
+                'bonus': st.bonus,
+            }
+            for st in character.saving_throws.all()
+        ],
+        'proficiencies': [
+            {
+                'proficiency_type': cp.proficiency_type,
+                'proficiency_name': cp.proficiency_name,
+            }
+            for cp in character.proficiencies.all()
+        ],
+        'equipment': [
+            {
+                'equipment': {
+                    'id': ce.equipment.id,
+                    'name': ce.equipment.name,
+                    'equipment_type': ce.equipment.equipment_type,
+                },
+                'quantity': ce.quantity,
+                'equipped': ce.equipped,
+                'attuned': ce.attuned,
+            }
+            for ce in character.equipment.all()
+        ],
+        'spells': [
+            {
+                'spell': {
+                    'id': cs.spell.id,
+                    'name': cs.spell.name,
+                    'spell_level': cs.spell.spell_level,
+                    'school': cs.spell.school,
+                },
+                'always_prepared': cs.always_prepared,
+                'prepared': cs.prepared,
+            }
+            for cs in character.spells.all()
+        ],
+        'feats': [
+            {
+                'feat': cf.feat_id,
+                'source': cf.source,
+                'choice_made': cf.choice_made,
+            }
+            for cf in character.feats.all()
+        ],
+        'languages': [
+            {'language': cl.language_id}
+            for cl in character.languages.all()
+        ],
+    })
+    return data
+
+
 class IsOwnerOrReadOnly(permissions.BasePermission):
     """
     Custom permission to only allow owners of a character to edit it.
@@ -31,7 +248,7 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
             return True
 
         # Write permissions are only allowed to the owner of the character.
-        return obj.user == request.user
+        return obj.user_id == request.user.pk
 
 
 class CharacterViewSet(viewsets.ModelViewSet):
@@ -40,17 +257,60 @@ class CharacterViewSet(viewsets.ModelViewSet):
     """
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly]
     filter_backends = [DjangoFilterBackend]
-    filterset_fields = ['character_state', 'dnd_class', 'species', 'level', 'is_complete']
+    filterset_class = CharacterFilter
+    pagination_class = LastModifiedCursorPagination
     ordering = ['-last_modified_date']
 
     def get_queryset(self):
         """Return characters for the current user with optimized queries"""
-        return Character.objects.filter(
-            user=self.request.user
-        ).select_related(
-            'dnd_class', 'subclass', 'background', 'species', 'abilities', 'details'
+        queryset = Character.objects.filter(user=self.request.user)
+
+        # list() reads joined columns through .values(), so nothing is loaded eagerly
+        if self.action == 'list':
+            return queryset
+
+        # Deleting only needs the row itself
+        if self.action == 'destroy':
+            return queryset
+
+        # duplicate copies the character row, its lookups and abilities, nothing else
+        if self.action == 'duplicate':
+            return queryset.select_related('dnd_class', 'background', 'species', 'abilities')
+
+        # The stat calculations read abilities and lookups from the character and query
+        # the rows they need (equipment with armor, proficient saves) themselves
+        if self.action == 'calculate_stats':
+            return queryset.select_related('dnd_class', 'species', 'abilities')
+
+        # Detail views render every related collection, trimmed to the columns the
+        # nested serializers read
+        return queryset.select_related(
+            'dnd_class', 'background', 'species', 'abilities', 'details'
         ).prefetch_related(
-            'skills', 'equipment', 'spells', 'feats', 'languages'
+            Prefetch('skills', queryset=CharacterSkill.objects.select_related('skill').only(
+                'character_id', 'proficiency_type',
+                'skill__id', 'skill__name', 'skill__associated_ability'
+            )),
+            Prefetch('saving_throws', queryset=CharacterSavingThrow.objects.only(
+                'character_id', 'ability_name', 'is_proficient'
+            )),
+            Prefetch('proficiencies', queryset=CharacterProficiency.objects.only(
+                'character_id', 'proficiency_type', 'proficiency_name'
+            )),
+            Prefetch('equipment', queryset=CharacterEquipment.objects.select_related('equipment').only(
+                'character_id', 'quantity', 'equipped', 'attuned',
+                'equipment__id', 'equipment__name', 'equipment__equipment_type'
+            )),
+            Prefetch('spells', queryset=CharacterSpell.objects.select_related('spell').only(
+                'character_id', 'always_prepared', 'prepared',
+                'spell__id', 'spell__name', 'spell__spell_level', 'spell__school'
+            )),
+            Prefetch('feats', queryset=CharacterFeat.objects.only(
+                'character_id', 'feat_id', 'source', 'choice_made'
+            )),
+            Prefetch('languages', queryset=CharacterLanguage.objects.only(
+                'character_id', 'language'
+            )),
         )
 
     def get_serializer_class(self):
@@ -62,10 +322,103 @@ class CharacterViewSet(viewsets.ModelViewSet):
         else:
             return CharacterDetailSerializer
 
+    # Columns read by list(), which builds CharacterListSerializer's payload from .values()
+    LIST_VALUES = (
+        'id', 'character_name', 'level', 'character_state', 'is_complete', 'last_modified_date',
+        'dnd_class__id', 'dnd_class__name', 'dnd_class__primary_ability', 'dnd_class__hit_die',
+        'species__id', 'species__name', 'species__size', 'species__speed',
+        'background__id', 'background__name',
+    )
+
+    def list(self, request, *args, **kwargs):
+        """
+        List characters from .values() rows rather than model instances; the payload has
+        the same shape CharacterListSerializer produces
+        """
+        queryset = self.filter_queryset(self.get_queryset()).values(*self.LIST_VALUES)
+
+        page = self.paginate_queryset(queryset)
+        rows = page if page is not None else queryset
+        data = [self._list_item(row) for row in rows]
+
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+    @staticmethod
+    def _list_item(row):
+        """Shape one .values() row like CharacterListSerializer"""
+        dnd_class = None
+        level_display = f"Level {row['level']}"
+        if row['dnd_class__id'] is not None:
+            dnd_class = {
+                'id': row['dnd_class__id'],
+                'name': row['dnd_class__name'],
+                'primary_ability': row['dnd_class__primary_ability'],
+                'hit_die': row['dnd_class__hit_die'],
+            }
+            level_display = f"{level_display} {row['dnd_class__name']}"
+
+        species = None
+        if row['species__id'] is not None:
+            species = {
+                'id': row['species__id'],
+                'name': row['species__name'],
+                'size': row['species__size'],
+                'speed': row['species__speed'],
+            }
+
+        background = None
+        if row['background__id'] is not None:
+            background = {'id': row['background__id'], 'name': row['background__name']}
+
+        return {
+            'id': row['id'],
+            'character_name': row['character_name'],
+            'level': row['level'],
+            'level_display': level_display,
+            'dnd_class': dnd_class,
+            'species': species,
+            'background': background,
+            'character_state': row['character_state'],
+            'is_complete': row['is_complete'],
+            'last_modified_date': row['last_modified_date'],
+        }
+
+    def retrieve(self, request, *args, **kwargs):
+        """Return the detail payload without running CharacterDetailSerializer"""
+        not_modified = self._not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+
+        character = self.get_object()
+        return Response(
+            _character_to_dict(character),
+            headers=self._validators(character.pk, character.last_modified_date)
+        )
+
     def perform_create(self, serializer):
         """Set the character owner to the current user"""
         serializer.save(user=self.request.user)
 
+    def update(self, request, *args, **kwargs):
+        """
+        Apply the update through CharacterDetailSerializer, then render the saved character
+        with _character_to_dict. The serializer only writes the character row, so the
+        collections prefetched by get_object() are still current and are reused rather
+        than cleared and re-queried as UpdateModelMixin does.
+        """
+        partial = kwargs.pop('partial', False)
+        character = self.get_object()
+        serializer = self.get_serializer(character, data=request.data, partial=partial)
+        serializer.is_valid(raise_exception=True)
+        self.perform_update(serializer)
+
+        return Response(
+            _character_to_dict(character),
+            headers=self._validators(character.pk, character.last_modified_date)
+        )
+
     @action(detail=True, methods=['post'])
     def duplicate(self, request, pk=None):
         """Create a copy of an existing character"""
@@ -73,50 +426,54 @@ class CharacterViewSet(viewsets.ModelViewSet):
 
         # Create a duplicate with modified name
         duplicate_name = f"{character.character_name} (Copy)"
-        duplicate = Character.objects.create(
-            user=request.user,
-            character_name=duplicate_name,
-            dnd_class=character.dnd_class,
-            subclass=character.subclass,
-            background=character.background,
-            species=character.species,
-            alignment=character.alignment,
-            level=character.level,
-            character_state='draft'  # Always start as draft
-        )
+        with transaction.atomic():
+            duplicate = Character.objects.create(
+                user=request.user,
+                character_name=duplicate_name,
+                dnd_class=character.dnd_class,
+                subclass_id=character.subclass_id,
+                background=character.background,
+                species=character.species,
+                alignment=character.alignment,
+                level=character.level,
+                character_state='draft'  # Always start as draft
+            )
 
-        # Copy abilities if they exist
-        if hasattr(character, 'abilities'):
-            duplicate.abilities = character.abilities
-            duplicate.abilities.pk = None
-            duplicate.abilities.character = duplicate
-            duplicate.abilities.save()
+            # Copy abilities if they exist, leaving the source row untouched
+            abilities = _related_or_none(character, 'abilities')
+            if abilities is not None:
+                CharacterAbilities.objects.create(character=duplicate, **{
+                    field.name: getattr(abilities, field.name)
+                    for field in CharacterAbilities._meta.concrete_fields
+                    if field.name not in ('id', 'character')
+                })
+                # characters.signals bumped the copy's version when its abilities were saved
+                duplicate.refresh_from_db(fields=['last_modified_date'])
 
-        serializer = CharacterDetailSerializer(duplicate, context={'request': request})
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        # The copy has no details or child rows yet, so render them empty without querying
+        return Response(
+            _character_to_dict(duplicate, with_relations=False), status=status.HTTP_201_CREATED
+        )
 
     @action(detail=True, methods=['post'])
     def finalize(self, request, pk=None):
         """Mark a character as complete"""
-        character = self.get_object()
-        character.is_complete = True
-        character.character_state = 'complete'
-        character.save()
-
-        serializer = CharacterDetailSerializer(character, context={'request': request})
-        return Response(serializer.data)
+        return self._update_character_fields(
+            request, {'is_complete': True, 'character_state': 'complete'}
+        )
 
     @action(detail=True, methods=['get'])
     def sheet(self, request, pk=None):
         """Get character data formatted for character sheet display"""
-        character = self.get_object()
+        not_modified = self._not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
 
-        # Use the detail serializer but could create a specialized one later
-        serializer = CharacterDetailSerializer(character, context={'request': request})
+        character = self.get_object()
 
         # Get comprehensive calculated stats
         try:
-            calculated_stats = CharacterCalculationService.calculate_all_stats(character)
+            calculated_stats = self._cached_stats(character)
         except Exception as e:
             calculated_stats = {
                 'error': f'Failed to calculate stats: {str(e)}',
@@ -124,73 +481,197 @@ class CharacterViewSet(viewsets.ModelViewSet):
             }
 
         return Response({
-            'character': serializer.data,
+            'character': _character_to_dict(character),
             'calculated_stats': calculated_stats
-        })
+        }, headers=self._validators(character.pk, character.last_modified_date))
+
+    # Conditional GET for retrieve, sheet and calculate_stats, and result caching for
+    # the latter two and validate. last_modified_date is the version: the step endpoints
+    # stamp it and characters.signals bumps it whenever a row hanging off the character
+    # changes.
+    STATS_CACHE_TTL = 60 * 60
+    VALIDATION_CACHE_TTL = 60 * 60
+
+    @staticmethod
+    def _etag(character_id, last_modified_date):
+        return f'W/"{character_id}-{last_modified_date.timestamp()}"'
+
+    @classmethod
+    def _validators(cls, character_id, last_modified_date):
+        """ETag and Last-Modified headers for a character version"""
+        return {
+            'ETag': cls._etag(character_id, last_modified_date),
+            'Last-Modified': http_date(last_modified_date.timestamp()),
+        }
+
+    def _current_version(self):
+        """
+        The requested character's (integer pk, last_modified_date), read without loading
+        the row. The pk is normalized so ETags match however the URL spelled it.
+        """
+        try:
+            character_id = int(self.kwargs['pk'])
+        except (TypeError, ValueError):
+            raise NotFound()
+
+        last_modified_date = Character.objects.filter(
+            pk=character_id, user=self.request.user
+        ).values_list('last_modified_date', flat=True).first()
+
+        if last_modified_date is None:
+            raise NotFound()
+        return character_id, last_modified_date
+
+    def _not_modified_response(self, request):
+        """
+        Return a 304 when the client's If-None-Match (or, without one, If-Modified-Since)
+        still matches the character's current version, else None
+        """
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if_modified_since = request.META.get('HTTP_IF_MODIFIED_SINCE')
+        # Unconditional requests go straight to the full load
+        if if_none_match is None and if_modified_since is None:
+            return None
+
+        character_id, last_modified_date = self._current_version()
+        validators = self._validators(character_id, last_modified_date)
+
+        if if_none_match is not None:
+            not_modified = validators['ETag'] in [tag.strip() for tag in if_none_match.split(',')]
+        else:
+            if_modified_since = parse_http_date_safe(if_modified_since)
+            not_modified = (
+                if_modified_since is not None
+                and int(last_modified_date.timestamp()) <= if_modified_since
+            )
+
+        if not_modified:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=validators)
+        return None
+
+    def _cached_stats(self, character):
+        """
+        calculate_all_stats memoized per character version. A miss is computed once even
+        when sheet and calculate_stats arrive together on threaded workers.
+        """
+        key = f'charstats:{character.pk}:{character.last_modified_date.timestamp()}'
+        return cache.get_or_set(
+            key,
+            lambda: _single_flight(
+                key, lambda: CharacterCalculationService.calculate_all_stats(character)
+            ),
+            self.STATS_CACHE_TTL
+        )
 
     # Step-specific update endpoints
+    def _update_response(self, request, character_id, updated, last_modified_date):
+        """
+        Acknowledge an update with just the values written; pass ?full=1 to get the
+        complete detail payload instead
+        """
+        headers = self._validators(character_id, last_modified_date)
+        if request.query_params.get('full') == '1':
+            return Response(_character_to_dict(self.get_object()), headers=headers)
+
+        return Response({
+            'id': character_id,
+            'updated': updated,
+            'last_modified_date': last_modified_date,
+        }, headers=headers)
+
+    def _write_character_fields(self, request, values):
+        """
+        Write the given model field values in a single UPDATE, without loading the row,
+        and return the new last_modified_date. Owner-only access is enforced by scoping
+        the update to the requesting user.
+        """
+        try:
+            character_id = int(self.kwargs['pk'])
+        except (TypeError, ValueError):
+            raise NotFound()
+
+        # Queryset updates skip auto_now, so stamp the modification time explicitly
+        last_modified_date = timezone.now()
+        updated_rows = Character.objects.filter(
+            pk=character_id, user=request.user
+        ).update(last_modified_date=last_modified_date, **values)
+
+        if not updated_rows:
+            raise NotFound()
+
+        return last_modified_date
+
+    def _update_character_fields(self, request, values):
+        """Write the given character fields and acknowledge the update"""
+        last_modified_date = self._write_character_fields(request, values)
+        return self._update_response(request, int(self.kwargs['pk']), values, last_modified_date)
+
+    def _update_step_fields(self, request, data):
+        """
+        Validate client-supplied step values (a 400 for bad input) and write them as
+        column values, e.g. {'dnd_class': '3'} becomes {'dnd_class_id': 3}
+        """
+        serializer = CharacterStepUpdateSerializer(data=data, partial=True)
+        serializer.is_valid(raise_exception=True)
+
+        values = {}
+        for name, value in serializer.validated_data.items():
+            field = Character._meta.get_field(name)
+            if field.is_relation:
+                values[field.attname] = value.pk if value is not None else None
+            else:
+                values[field.attname] = value
+
+        return self._update_character_fields(request, values)
+
     @action(detail=True, methods=['put', 'patch'], url_path='class')
     def update_class(self, request, pk=None):
         """Update character's class and subclass"""
-        character = self.get_object()
-
-        if 'dnd_class' in request.data:
-            character.dnd_class_id = request.data['dnd_class']
-        if 'subclass' in request.data:
-            character.subclass_id = request.data['subclass']
-
-        character.save()
-        serializer = CharacterDetailSerializer(character, context={'request': request})
-        return Response(serializer.data)
+        return self._update_step_fields(request, {
+            name: request.data[name] for name in ('dnd_class', 'subclass') if name in request.data
+        })
 
     @action(detail=True, methods=['put', 'patch'], url_path='background')
     def update_background(self, request, pk=None):
         """Update character's background"""
-        character = self.get_object()
-        character.background_id = request.data.get('background')
-        character.save()
-
-        serializer = CharacterDetailSerializer(character, context={'request': request})
-        return Response(serializer.data)
+        return self._update_step_fields(request, {'background': request.data.get('background')})
 
     @action(detail=True, methods=['put', 'patch'], url_path='species')
     def update_species(self, request, pk=None):
         """Update character's species"""
-        character = self.get_object()
-        character.species_id = request.data.get('species')
-        character.save()
-
-        serializer = CharacterDetailSerializer(character, context={'request': request})
-        return Response(serializer.data)
+        return self._update_step_fields(request, {'species': request.data.get('species')})
 
     @action(detail=True, methods=['put', 'patch'], url_path='ability-scores')
     def update_ability_scores(self, request, pk=None):
         """Update character's ability scores"""
-        character = self.get_object()
-
-        # Get or create abilities
-        abilities, created = character.abilities.get_or_create(character=character)
-
-        # Update ability scores if provided
-        for ability in ['strength_score', 'dexterity_score', 'constitution_score',
-                       'intelligence_score', 'wisdom_score', 'charisma_score']:
-            if ability in request.data:
-                setattr(abilities, ability, request.data[ability])
-
-        abilities.save()
-
-        serializer = CharacterDetailSerializer(character, context={'request': request})
-        return Response(serializer.data)
+        # Validate every supplied score in one pass; unknown keys are ignored
+        serializer = CharacterAbilitiesUpdateSerializer(data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        updated = dict(serializer.validated_data)
+
+        # The new version stamp and the scores commit together, so a concurrent sheet,
+        # calculate_stats or validate can never cache old scores under the new version
+        with transaction.atomic():
+            # Stamping the character doubles as the owner check, so nothing is loaded
+            last_modified_date = self._write_character_fields(request, {})
+            character_id = int(self.kwargs['pk'])
+
+            # Update the abilities row in place, creating it only if the character has none
+            abilities = CharacterAbilities.objects.filter(character_id=character_id)
+            updated_rows = abilities.update(**updated) if updated else abilities.count()
+            if not updated_rows:
+                CharacterAbilities.objects.create(character_id=character_id, **updated)
+                # characters.signals stamped a later version when the new row was saved
+                last_modified_date = Character.objects.filter(pk=character_id).values_list(
+                    'last_modified_date', flat=True
+                ).get()
+
+        return self._update_response(request, character_id, updated, last_modified_date)
 
     @action(detail=True, methods=['put', 'patch'], url_path='alignment')
     def update_alignment(self, request, pk=None):
         """Update character's alignment"""
-        character = self.get_object()
-        character.alignment = request.data.get('alignment', '')
-        character.save()
-
-        serializer = CharacterDetailSerializer(character, context={'request': request})
-        return Response(serializer.data)
+        return self._update_step_fields(request, {'alignment': request.data.get('alignment', '')})
 
     @action(detail=True, methods=['get'])
     def calculate_stats(self, request, pk=None):
@@ -205,11 +686,15 @@ class CharacterViewSet(viewsets.ModelViewSet):
         - Spell statistics
         - Carrying capacity
         """
+        not_modified = self._not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+
         character = self.get_object()
 
         try:
-            stats = CharacterCalculationService.calculate_all_stats(character)
-            return Response(stats)
+            stats = self._cached_stats(character)
+            return Response(stats, headers=self._validators(character.pk, character.last_modified_date))
         except Exception as e:
             return Response(
                 {'error': f'Failed to calculate stats: {str(e)}'},
@@ -224,28 +709,42 @@ class CharacterViewSet(viewsets.ModelViewSet):
         Validates the character build against D&D rules.
         Returns any validation errors or success message.
         """
-        character = self.get_object()
-
-        try:
-            validation_service = CharacterValidationService(character)
-            errors = validation_service.validate_character()
+        # Results are cached per character version, so repeat checks of an unchanged
+        # character only read last_modified_date
+        character_id, last_modified_date = self._current_version()
+        cache_key = f'charvalid:{character_id}:{last_modified_date.timestamp()}'
+        payload = cache.get(cache_key)
+
+        if payload is None:
+            # The validators read a narrower set of columns than get_queryset() loads
+            try:
+                character = CharacterValidationService.get_character_for_validation(
+                    character_id, request.user
+                )
+            except Character.DoesNotExist:
+                raise NotFound()
+
+            try:
+                errors = CharacterValidationService.validate_complete_character(character)
+            except Exception as e:
+                return Response(
+                    {'error': f'Validation failed: {str(e)}'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
 
             if errors:
-                return Response({
+                payload = {
                     'valid': False,
                     'errors': errors
-                })
+                }
             else:
-                return Response({
+                payload = {
                     'valid': True,
                     'message': 'Character build is valid!'
-                })
+                }
+            cache.set(cache_key, payload, self.VALIDATION_CACHE_TTL)
 
-        except Exception as e:
-            return Response(
-                {'error': f'Validation failed: {str(e)}'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        return Response(payload, headers=self._validators(character_id, last_modified_date))
 
     @action(detail=False, methods=['post'])
     def roll_ability_scores(self, request):
@@ -258,18 +757,14 @@ class CharacterViewSet(viewsets.ModelViewSet):
         try:
             ability_rolls = DiceRollerService.roll_standard_ability_scores()
 
-            # Convert to simple scores
+            # Build both views of the rolls in a single pass
             scores = {}
+            details = {}
             for ability, roll_result in ability_rolls.items():
                 scores[ability] = roll_result.total
+                details[ability] = {'rolls': roll_result.individual_rolls, 'total': roll_result.total}
 
-            return Response({
-                'scores': scores,
-                'details': {ability: {
-                    'rolls': roll_result.individual_rolls,
-                    'total': roll_result.total
-                } for ability, roll_result in ability_rolls.items()}
-            })
+            return Response({'scores': scores, 'details': details})
 
         except Exception as e:
             return Response(
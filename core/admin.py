@@ -1,3 +1,20 @@
-from django.contrib import admin
+"""
+Shared admin helpers
+"""
 
-# Register your models here.
+
+class SelectRelatedAdminMixin:
+    """
+    Join or prefetch the listed relations in get_queryset, for ModelAdmins and
+    inlines whose rows or __str__ read related objects
+    """
+    select_related_fields = ()
+    prefetch_related_fields = ()
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if self.select_related_fields:
+            queryset = queryset.select_related(*self.select_related_fields)
+        if self.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*self.prefetch_related_fields)
+        return queryset
@@ -0,0 +1,14 @@
+"""
+Core API pagination classes
+"""
+from rest_framework.pagination import CursorPagination
+
+
+class LastModifiedCursorPagination(CursorPagination):
+    """
+    Keyset pagination, most recently modified first.
+
+    Each page continues from the previous page's last position instead of an OFFSET,
+    so deep pages cost the same as the first, and no COUNT(*) query is needed.
+    """
+    ordering = ('-last_modified_date', '-id')
@@ -1,8 +1,8 @@
 """
 Core API URLs - Main API router for the D&D Character Creator
 """
-from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from django.urls import include, path, re_path
+from rest_framework.routers import SimpleRouter
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
@@ -13,8 +13,9 @@ from game_content import viewsets as game_viewsets
 from characters import viewsets as character_viewsets
 from users import viewsets as user_viewsets
 
-# Create the main API router
-router = DefaultRouter()
+# Create the main API router. SimpleRouter skips DefaultRouter's browsable API root
+# view and .json format-suffix routes, which nothing here uses
+router = SimpleRouter()
 
 # User management
 router.register(r'users', user_viewsets.UserViewSet, basename='user')
@@ -41,13 +42,8 @@ urlpatterns = [
     path('auth/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('auth/', include('users.urls')),  # Additional auth endpoints
 
-    # Characters app URLs (includes utility endpoints)
-    path('', include('characters.urls')),
-
-    # API versioning - include all router URLs under v1
-    path('v1/', include(router.urls)),
-    path('v1/', include('characters.urls')),
-
-    # API root (latest version defaults to v1)
-    path('', include(router.urls)),
-]
\ No newline at end of file
+    # Router URLs under v1/, and unprefixed as the latest version (the frontend calls
+    # /api/characters/ etc.). One optional-prefix mount serves both, so the router's
+    # patterns are resolved and reversed once; reverse() yields the unprefixed URL.
+    re_path(r'^(?:v1/)?', include(router.urls)),
+]
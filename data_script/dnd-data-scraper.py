@@ -3,14 +3,17 @@ D&D 5e.tools Data Scraper
 Crawls 5e.tools to gather all game content data for database population.
 
 Requirements:
-    pip install requests beautifulsoup4 lxml tqdm
+    pip install requests beautifulsoup4 lxml tqdm orjson
 """
 
-import json
+import hashlib
 import os
+import sys
 import time
+import orjson
 import requests
 import urllib3
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 from datetime import datetime
@@ -31,49 +34,117 @@ class FiveEToolsScraper:
     # 5e.tools data repository (they host JSON files)
     BASE_URL = "https://5e.tools/data"
     GITHUB_RAW_URL = "https://raw.githubusercontent.com/TheGiddyLimit/TheGiddyLimit.github.io/master/data"
+
+    # Most files fetched at once; also the session's connection pool size
+    MAX_CONCURRENT_FETCHES = 10
+
+    # Item type codes that carry an armor_type
+    ARMOR_TYPES = frozenset({'LA', 'MA', 'HA', 'S'})
+
+    # Spell files, PHB first
+    SPELL_SOURCES = [
+        "spells-phb.json",
+        "spells-xge.json",
+        "spells-tce.json",
+        "spells-ftd.json"
+    ]
     
-    def __init__(self, output_dir: str = "dnd_data"):
+    def __init__(self, output_dir: str = "dnd_data", use_cache: bool = True):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        # Downloaded files are kept here and revalidated with ETag/Last-Modified,
+        # so re-runs only transfer what changed upstream
+        self.cache_dir = self.output_dir / ".http_cache" if use_cache else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(exist_ok=True)
+        # Item counts of the files saved this run, so the summary needn't re-read them
+        self._counts: Dict[str, int] = {}
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'DnD-Character-Creator-DataScraper/1.0'
         })
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.MAX_CONCURRENT_FETCHES)
+        self.session.mount('https://', adapter)
         
     def log(self, message: str):
         """Log with timestamp."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         print(f"[{timestamp}] {message}")
         
+    def progress(self, iterable, **kwargs):
+        """Wrap iterable in a progress bar, shown only when stderr is a terminal."""
+        return tqdm(iterable, mininterval=0.5, disable=not sys.stderr.isatty(), **kwargs)
+        
+    def _cache_paths(self, url: str):
+        """Paths of the cached body and the conditional request headers for url."""
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.body", self.cache_dir / f"{key}.headers"
+
+    def _store_cached(self, url: str, response: requests.Response):
+        """Save a response body with the validators needed to revalidate it later."""
+        conditional_headers = {}
+        if response.headers.get('ETag'):
+            conditional_headers['If-None-Match'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            conditional_headers['If-Modified-Since'] = response.headers['Last-Modified']
+        if not conditional_headers:
+            return
+
+        body_path, headers_path = self._cache_paths(url)
+        body_path.write_bytes(response.content)
+        # Headers are written last: their presence means the body is complete
+        headers_path.write_bytes(orjson.dumps(conditional_headers))
+
     def fetch_json(self, url: str, retries: int = 3) -> Optional[Dict]:
-        """Fetch JSON data from URL with retry logic."""
+        """Fetch JSON data from URL with retry logic, reusing the on-disk cache when unchanged."""
+        body_path = None
+        conditional_headers = {}
+        if self.cache_dir is not None:
+            body_path, headers_path = self._cache_paths(url)
+            if headers_path.exists():
+                conditional_headers = orjson.loads(headers_path.read_bytes())
+
         for attempt in range(retries):
             try:
-                response = self.session.get(url, timeout=30, verify=False)
+                response = self.session.get(url, timeout=30, verify=False, headers=conditional_headers)
+                if response.status_code == 304:
+                    return orjson.loads(body_path.read_bytes())
                 response.raise_for_status()
-                return response.json()
-            except requests.exceptions.RequestException as e:
+                # orjson parses the raw bytes directly, skipping the text decode
+                data = orjson.loads(response.content)
+                if self.cache_dir is not None:
+                    self._store_cached(url, response)
+                return data
+            except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
                 self.log(f"Attempt {attempt + 1}/{retries} failed for {url}: {e}")
                 if attempt < retries - 1:
                     time.sleep(2 ** attempt)  # Exponential backoff
                 else:
                     self.log(f"Failed to fetch {url} after {retries} attempts")
+                    if conditional_headers:
+                        self.log(f"Using cached copy of {url}")
+                        return orjson.loads(body_path.read_bytes())
                     return None
+
+    def fetch_many(self, urls: List[str]) -> List[Optional[Dict]]:
+        """Fetch several JSON files concurrently; results are in the order of urls."""
+        if not urls:
+            return []
+        workers = min(self.MAX_CONCURRENT_FETCHES, len(urls))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.fetch_json, urls))
                     
     def save_json(self, data: Any, filename: str):
         """Save data as JSON file."""
         filepath = self.output_dir / filename
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        self._counts[filename] = len(data) if isinstance(data, list) else 1
         self.log(f"Saved {filename}")
         
     def scrape_classes(self) -> List[Dict]:
         """Scrape all class data."""
         self.log("Scraping classes...")
         
-        # 5e.tools stores class data in classes.json
-        url = f"{self.GITHUB_RAW_URL}/class/class-artificer.json"
-        
         classes_data = []
         class_files = [
             "class-artificer.json",
@@ -91,9 +162,9 @@ class FiveEToolsScraper:
             "class-wizard.json"
         ]
         
-        for class_file in tqdm(class_files, desc="Fetching classes"):
-            url = f"{self.GITHUB_RAW_URL}/class/{class_file}"
-            data = self.fetch_json(url)
+        # Download every class file at once, then process them in order
+        urls = [f"{self.GITHUB_RAW_URL}/class/{class_file}" for class_file in class_files]
+        for data in self.progress(self.fetch_many(urls), total=len(urls), desc="Processing classes"):
             if data and 'class' in data:
                 for cls in data['class']:
                     # Extract relevant class information
@@ -197,7 +268,7 @@ class FiveEToolsScraper:
         
         backgrounds_data = []
         if data and 'background' in data:
-            for bg in tqdm(data['background'], desc="Processing backgrounds"):
+            for bg in self.progress(data['background'], desc="Processing backgrounds"):
                 background_info = {
                     'name': bg.get('name'),
                     'source': bg.get('source'),
@@ -225,7 +296,7 @@ class FiveEToolsScraper:
         
         races_data = []
         if data and 'race' in data:
-            for race in tqdm(data['race'], desc="Processing races"):
+            for race in self.progress(data['race'], desc="Processing races"):
                 race_info = {
                     'name': race.get('name'),
                     'source': race.get('source'),
@@ -266,7 +337,7 @@ class FiveEToolsScraper:
         
         feats_data = []
         if data and 'feat' in data:
-            for feat in tqdm(data['feat'], desc="Processing feats"):
+            for feat in self.progress(data['feat'], desc="Processing feats"):
                 feat_info = {
                     'name': feat.get('name'),
                     'source': feat.get('source'),
@@ -285,61 +356,41 @@ class FiveEToolsScraper:
         """Scrape all spell data."""
         self.log("Scraping spells...")
         
-        url = f"{self.GITHUB_RAW_URL}/spells/spells-phb.json"
-        data = self.fetch_json(url)
+        # All spell sources are downloaded together
+        spell_files = self.fetch_many(
+            [f"{self.GITHUB_RAW_URL}/spells/{spell_file}" for spell_file in self.SPELL_SOURCES]
+        )
         
         spells_data = []
-        if data and 'spell' in data:
-            for spell in tqdm(data['spell'], desc="Processing spells"):
-                spell_info = {
-                    'name': spell.get('name'),
-                    'source': spell.get('source'),
-                    'level': spell.get('level', 0),
-                    'school': spell.get('school'),
-                    'casting_time': spell.get('time', []),
-                    'range': spell.get('range', {}),
-                    'components': spell.get('components', {}),
-                    'duration': spell.get('duration', []),
-                    'description': spell.get('entries', []),
-                    'higher_levels': spell.get('entriesHigherLevel', []),
-                    'classes': self._extract_spell_classes(spell),
-                    'concentration': spell.get('duration', [{}])[0].get('concentration', False) if spell.get('duration') else False,
-                    'ritual': spell.get('ritual', False)
-                }
-                spells_data.append(spell_info)
-                
-        # Fetch additional spell sources
-        additional_sources = [
-            "spells-xge.json",
-            "spells-tce.json",
-            "spells-ftd.json"
-        ]
-        
-        for source in additional_sources:
-            url = f"{self.GITHUB_RAW_URL}/spells/{source}"
-            data = self.fetch_json(url)
+        for spell_file, data in zip(self.SPELL_SOURCES, spell_files):
             if data and 'spell' in data:
-                for spell in data['spell']:
-                    spell_info = {
-                        'name': spell.get('name'),
-                        'source': spell.get('source'),
-                        'level': spell.get('level', 0),
-                        'school': spell.get('school'),
-                        'casting_time': spell.get('time', []),
-                        'range': spell.get('range', {}),
-                        'components': spell.get('components', {}),
-                        'duration': spell.get('duration', []),
-                        'description': spell.get('entries', []),
-                        'higher_levels': spell.get('entriesHigherLevel', []),
-                        'classes': self._extract_spell_classes(spell),
-                        'concentration': spell.get('duration', [{}])[0].get('concentration', False) if spell.get('duration') else False,
-                        'ritual': spell.get('ritual', False)
-                    }
-                    spells_data.append(spell_info)
+                spells_data.extend(
+                    self._build_spell_info(spell)
+                    for spell in self.progress(data['spell'], desc=f"Processing {spell_file}")
+                )
                     
         self.save_json(spells_data, "spells.json")
         return spells_data
         
+    def _build_spell_info(self, spell: Dict) -> Dict:
+        """Build the output record for a single spell."""
+        duration = spell.get('duration', [])
+        return {
+            'name': spell.get('name'),
+            'source': spell.get('source'),
+            'level': spell.get('level', 0),
+            'school': spell.get('school'),
+            'casting_time': spell.get('time', []),
+            'range': spell.get('range', {}),
+            'components': spell.get('components', {}),
+            'duration': duration,
+            'description': spell.get('entries', []),
+            'higher_levels': spell.get('entriesHigherLevel', []),
+            'classes': self._extract_spell_classes(spell),
+            'concentration': duration[0].get('concentration', False) if duration else False,
+            'ritual': spell.get('ritual', False)
+        }
+        
     def _extract_spell_classes(self, spell: Dict) -> List[str]:
         """Extract which classes can cast this spell."""
         classes = []
@@ -363,11 +414,12 @@ class FiveEToolsScraper:
         
         equipment_data = []
         if data and 'item' in data:
-            for item in tqdm(data['item'], desc="Processing equipment"):
+            for item in self.progress(data['item'], desc="Processing equipment"):
+                item_type = item.get('type')
                 equipment_info = {
                     'name': item.get('name'),
                     'source': item.get('source'),
-                    'type': item.get('type'),
+                    'type': item_type,
                     'rarity': item.get('rarity', 'none'),
                     'value': item.get('value'),
                     'weight': item.get('weight'),
@@ -380,7 +432,7 @@ class FiveEToolsScraper:
                     'range': item.get('range'),
                     # Armor-specific
                     'armor_class': item.get('ac'),
-                    'armor_type': item.get('type') if item.get('type') in ['LA', 'MA', 'HA', 'S'] else None,
+                    'armor_type': item_type if item_type in self.ARMOR_TYPES else None,
                     'strength_requirement': item.get('strength'),
                     'stealth_disadvantage': item.get('stealth', False)
                 }
@@ -491,12 +543,15 @@ class FiveEToolsScraper:
         }
         
         for json_file in self.output_dir.glob("*.json"):
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                summary['files'][json_file.name] = {
-                    'count': len(data) if isinstance(data, list) else 1,
-                    'size_kb': json_file.stat().st_size / 1024
-                }
+            count = self._counts.get(json_file.name)
+            if count is None:
+                # Left over from an earlier run, so it has to be read
+                data = orjson.loads(json_file.read_bytes())
+                count = len(data) if isinstance(data, list) else 1
+            summary['files'][json_file.name] = {
+                'count': count,
+                'size_kb': json_file.stat().st_size / 1024
+            }
                 
         self.save_json(summary, "_summary.json")
         
@@ -23,7 +23,7 @@ ALLOWED_HOSTS = ['*']
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 
 # Debug toolbar for development
-if 'django_debug_toolbar' in [app for app_list in [DJANGO_APPS, THIRD_PARTY_APPS, LOCAL_APPS] for app in app_list]:
+if 'django_debug_toolbar' in INSTALLED_APPS:
     MIDDLEWARE.insert(0, 'debug_toolbar.middleware.DebugToolbarMiddleware')
     INTERNAL_IPS = ['127.0.0.1', 'localhost']
 
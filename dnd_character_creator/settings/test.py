@@ -0,0 +1,36 @@
+"""
+Test settings for dnd_character_creator project.
+"""
+from .base import *
+
+DEBUG = False
+
+# Fast, isolated in-memory database for the test suite
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+# Base settings also log to logs/django.log; keep tests on the console only
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'root': {
+        'handlers': ['console'],
+        'level': 'WARNING',
+    },
+}
+
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+# Patches the ORM for nplusone so query-budget tests can wrap code in
+# nplusone.core.profiler.Profiler. Deliberately no NPlusOneMiddleware: raising on
+# every request would 500 ordinary API/admin tests on harmless eager loads.
+INSTALLED_APPS = INSTALLED_APPS + ['nplusone.ext.django']
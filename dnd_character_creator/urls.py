@@ -19,7 +19,7 @@ def tools_page(request):
     """D&D tools - placeholder"""
     return render(request, 'pages/tools.html')
 
-urlpatterns = [
+_patterns = [
     # Admin
     path('admin/', admin.site.urls),
 
@@ -42,5 +42,8 @@ urlpatterns = [
 
 # Serve media files in development
 if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
-    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
+    _patterns.extend(static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT))
+    _patterns.extend(static(settings.STATIC_URL, document_root=settings.STATIC_ROOT))
+
+# Fixed once built; the resolver only iterates it
+urlpatterns = tuple(_patterns)
@@ -10,7 +10,12 @@ https://docs.djangoproject.com/en/4.2/howto/deployment/wsgi/
 import os
 
 from django.core.wsgi import get_wsgi_application
+from django.urls import reverse
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dnd_character_creator.settings.production')
 
 application = get_wsgi_application()
+
+# Resolve one URL at worker startup so the URLconf is imported and its reverse
+# tables built before the first request rather than during it
+reverse('admin:index')
@@ -1,4 +1,6 @@
 from django.contrib import admin
+
+from core.admin import SelectRelatedAdminMixin
 from .models import (
     Skill, Language, Feat, Species, SpeciesTrait,
     DnDClass, ClassFeature, Subclass, Background,
@@ -30,10 +32,12 @@ class FeatAdmin(admin.ModelAdmin):
     ordering = ('feat_type', 'name')
 
 
-class SpeciesTraitInline(admin.TabularInline):
+class SpeciesTraitInline(SelectRelatedAdminMixin, admin.TabularInline):
     model = SpeciesTrait
     extra = 0
     fields = ('name', 'trait_type', 'description')
+    # Each row's __str__ reads the species name
+    select_related_fields = ('species',)
 
 
 @admin.register(Species)
@@ -57,11 +61,13 @@ class SpeciesAdmin(admin.ModelAdmin):
     )
 
 
-class ClassFeatureInline(admin.TabularInline):
+class ClassFeatureInline(SelectRelatedAdminMixin, admin.TabularInline):
     model = ClassFeature
     extra = 0
     fields = ('name', 'level_acquired', 'feature_type', 'uses_per_rest')
     ordering = ('level_acquired', 'name')
+    # Each row's __str__ reads the class name
+    select_related_fields = ('dnd_class',)
 
 
 @admin.register(DnDClass)
@@ -91,19 +97,32 @@ class DnDClassAdmin(admin.ModelAdmin):
 @admin.register(ClassFeature)
 class ClassFeatureAdmin(admin.ModelAdmin):
     list_display = ('name', 'dnd_class', 'level_acquired', 'feature_type')
-    list_filter = ('dnd_class', 'level_acquired', 'feature_type')
+    list_filter = (('dnd_class', admin.RelatedOnlyFieldListFilter), 'level_acquired', 'feature_type')
     search_fields = ('name', 'description')
     ordering = ('dnd_class', 'level_acquired', 'name')
+    list_select_related = ('dnd_class',)
+    show_full_result_count = False
+    autocomplete_fields = ('dnd_class',)
 
 
 @admin.register(Subclass)
 class SubclassAdmin(admin.ModelAdmin):
     list_display = ('name', 'dnd_class', 'level_available')
-    list_filter = ('dnd_class', 'level_available')
+    list_filter = (('dnd_class', admin.RelatedOnlyFieldListFilter), 'level_available')
     search_fields = ('name', 'description')
     ordering = ('dnd_class', 'name')
+    list_select_related = ('dnd_class',)
+    autocomplete_fields = ('dnd_class',)
     filter_horizontal = ('features',)
 
+    def formfield_for_manytomany(self, db_field, request, **kwargs):
+        """Join dnd_class for the feature choices, whose labels include the class name"""
+        if db_field.name == 'features':
+            kwargs['queryset'] = ClassFeature.objects.select_related('dnd_class').only(
+                'name', 'level_acquired', 'dnd_class__name'
+            )
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
+
 
 @admin.register(Background)
 class BackgroundAdmin(admin.ModelAdmin):
@@ -111,6 +130,7 @@ class BackgroundAdmin(admin.ModelAdmin):
     list_filter = ('origin_feat',)
     search_fields = ('name', 'description')
     ordering = ('name',)
+    list_select_related = ('origin_feat',)
 
     fieldsets = (
         ('Basic Info', {
@@ -134,6 +154,7 @@ class EquipmentAdmin(admin.ModelAdmin):
     list_filter = ('equipment_type',)
     search_fields = ('name', 'description')
     ordering = ('equipment_type', 'name')
+    show_full_result_count = False
 
 
 @admin.register(Weapon)
@@ -142,6 +163,7 @@ class WeaponAdmin(admin.ModelAdmin):
     list_filter = ('weapon_category', 'damage_type')
     search_fields = ('name', 'description')
     ordering = ('weapon_category', 'name')
+    show_full_result_count = False
 
     fieldsets = (
         ('Basic Info', {
@@ -168,6 +190,7 @@ class ArmorAdmin(admin.ModelAdmin):
     list_filter = ('armor_type', 'stealth_disadvantage')
     search_fields = ('name', 'description')
     ordering = ('armor_type', 'name')
+    show_full_result_count = False
 
     fieldsets = (
         ('Basic Info', {
@@ -191,6 +214,7 @@ class SpellAdmin(admin.ModelAdmin):
     list_filter = ('spell_level', 'school', 'concentration', 'ritual', 'available_to_classes')
     search_fields = ('name', 'description')
     ordering = ('spell_level', 'name')
+    show_full_result_count = False
     filter_horizontal = ('available_to_classes',)
 
     fieldsets = (
@@ -212,5 +236,19 @@ class SpellAdmin(admin.ModelAdmin):
     )
 
     def get_queryset(self, request):
-        """Optimize queryset with prefetch_related"""
-        return super().get_queryset(request).prefetch_related('available_to_classes')
+        """Trim the changelist's columns"""
+        queryset = super().get_queryset(request)
+        # The changelist only shows short columns; leave the description text
+        # unloaded there. The change form still gets full rows. available_to_classes
+        # isn't prefetched: the changelist never shows it and the change form reads
+        # it with one query either way.
+        changelist = f'{self.opts.app_label}_{self.opts.model_name}_changelist'
+        if request.resolver_match and request.resolver_match.url_name == changelist:
+            queryset = queryset.only(*self.list_display)
+        return queryset
+
+    def formfield_for_manytomany(self, db_field, request, **kwargs):
+        """Load only the columns the class choices display"""
+        if db_field.name == 'available_to_classes':
+            kwargs['queryset'] = DnDClass.objects.only('name')
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
@@ -2,18 +2,24 @@
 Base importer class for D&D data ETL operations.
 """
 
-import json
 import re
 from pathlib import Path
+
+import orjson
 from django.db import transaction
 from django.core.management.base import BaseCommand
 
+# An innermost {@tag text|...} reference (dice, damage, spells, creatures...),
+# compiled once for every entry of every import
+TAG_PATTERN = re.compile(r'\{@\w+\s+([^{}|]+)(?:\|[^{}]*)?\}')
+STRIP_BRACES = str.maketrans('', '', '{}')
+
 
 class BaseImporter(BaseCommand):
     """Base class for all D&D data importers."""
 
     # Valid sources for 5e content (excluding 2024/5.5e)
-    VALID_SOURCES = [
+    VALID_SOURCES = frozenset([
         'PHB', 'XGE', 'TCE', 'SCAG', 'MM', 'VGM', 'MTF', 'GGR', 'AI', 'EGW',
         'MOT', 'IDRotF', 'TCoE', 'FTD', 'SCC', 'DSotDQ', 'BMT', 'BPG', 'SAiS',
         'EGtW', 'OotA', 'PotA', 'SKT', 'TftYP', 'ToA', 'WDH', 'WDMM', 'GoS',
@@ -21,9 +27,9 @@ class BaseImporter(BaseCommand):
         'PSX', 'PSZ', 'HotDQ', 'RoT', 'LMoP', 'CoS', 'ALCoS', 'ALCurseOfStrahd',
         'DDAL', 'DDIA', 'DDEP', 'DDEX', 'VD', 'SCREEN', 'ScreenDungeonKit',
         'HEROES', 'RMR', 'RMBRE', 'AL', 'SatO', 'ToD', 'WDH', 'WDMM', 'GoS'
-    ]
+    ])
 
-    EXCLUDED_SOURCES = ['XPHB', 'UA', 'UAClassFeatureVariants', 'homebrew']
+    EXCLUDED_SOURCES = frozenset(['XPHB', 'UA', 'UAClassFeatureVariants', 'homebrew'])
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -33,6 +39,7 @@ class BaseImporter(BaseCommand):
         self.skipped_count = 0
         self.errors = []
         self.data_path = Path('data')  # Default data directory
+        self._pending = []  # Unsaved model instances for flush_pending()
 
     def add_arguments(self, parser):
         """Add common command arguments."""
@@ -65,7 +72,8 @@ class BaseImporter(BaseCommand):
             return
 
         if options.get('clear'):
-            self.clear_existing_data()
+            with transaction.atomic():
+                self.clear_existing_data()
 
         try:
             if options.get('dry_run'):
@@ -112,15 +120,15 @@ class BaseImporter(BaseCommand):
         if not text:
             return ""
 
-        # Remove common tags like {@creature ...}, {@spell ...}, etc.
-        text = re.sub(r'\{@\w+\s+([^}|]+)(?:\|[^}]+)?\}', r'\1', text)
-
-        # Remove dice notation tags
-        text = re.sub(r'\{@dice\s+([^}]+)\}', r'\1', text)
-        text = re.sub(r'\{@damage\s+([^}]+)\}', r'\1', text)
+        # Remove tags like {@creature ...}, {@spell ...}, {@dice ...}, etc. in one
+        # pass; nested tags such as {@b {@dice 1d6}} need one more pass per level
+        while '{@' in text:
+            text, replaced = TAG_PATTERN.subn(r'\1', text)
+            if not replaced:
+                break
 
         # Clean up any remaining curly braces
-        text = text.replace('{', '').replace('}', '')
+        text = text.translate(STRIP_BRACES)
 
         return text.strip()
 
@@ -131,7 +139,10 @@ class BaseImporter(BaseCommand):
 
         description_parts = []
 
-        for entry in entries:
+        # Walk nested entries depth-first with an explicit stack, in document order
+        stack = list(reversed(entries))
+        while stack:
+            entry = stack.pop()
             if isinstance(entry, str):
                 description_parts.append(self.clean_text(entry))
             elif isinstance(entry, dict):
@@ -145,8 +156,8 @@ class BaseImporter(BaseCommand):
                         elif isinstance(item, dict) and 'name' in item:
                             description_parts.append(f"• {item['name']}: {self.clean_text(item.get('entry', ''))}")
                 elif 'entries' in entry:
-                    # Recursive parsing
-                    description_parts.append(self.parse_entries(entry['entries']))
+                    # Nested entries are parsed before the rest of this level
+                    stack.extend(reversed(list(entry['entries'] or [])))
                 elif 'entry' in entry:
                     description_parts.append(self.clean_text(entry['entry']))
 
@@ -161,11 +172,10 @@ class BaseImporter(BaseCommand):
             return None
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.log(f"Loaded {filename}", level=2)
-                return data
-        except json.JSONDecodeError as e:
+            data = orjson.loads(file_path.read_bytes())
+            self.log(f"Loaded {filename}", level=2)
+            return data
+        except orjson.JSONDecodeError as e:
             self.errors.append(f"JSON decode error in {filename}: {str(e)}")
             self.log(f"Failed to parse {filename}: {str(e)}", level=1, style=self.style.ERROR)
             return None
@@ -182,10 +192,50 @@ class BaseImporter(BaseCommand):
         """Clear existing data - must be implemented by subclasses."""
         raise NotImplementedError("Subclasses must implement clear_existing_data()")
 
+    def delete_all(self, model, label):
+        """Delete every row of model for clear_existing_data(), logging how many went."""
+        # delete() reports per-model counts, so no separate exists()/count() queries
+        _, deleted = model.objects.all().delete()
+        count = deleted.get(model._meta.label, 0)
+        if count:
+            self.log(f"Deleted {count} existing {label}", style=self.style.WARNING)
+
     def validate_entry(self, entry):
         """Validate an entry - can be overridden by subclasses."""
         return True
 
+    def iter_transformed(self, entries, entry_label):
+        """
+        Yield transform_entry() output for each entry that passes is_valid_entry()
+        and validate_entry(), counting skips and recording errors as it goes.
+        """
+        for entry in entries:
+            try:
+                if not self.is_valid_entry(entry):
+                    self.skipped_count += 1
+                    if self.verbosity >= 2:
+                        self.log(f"Skipping {entry.get('name', 'Unknown')} from {entry.get('source', 'Unknown')}", level=2)
+                    continue
+
+                if not self.validate_entry(entry):
+                    self.skipped_count += 1
+                    if self.verbosity >= 2:
+                        self.log(f"Validation failed for {entry.get('name', 'Unknown')}", level=2, style=self.style.WARNING)
+                    continue
+
+                transformed = self.transform_entry(entry)
+
+            except Exception as e:
+                self.errors.append(f"Error processing {entry_label} {entry.get('name', 'Unknown')}: {str(e)}")
+                self.log(f"Error processing {entry_label}: {str(e)}", level=1, style=self.style.ERROR)
+                if self.verbosity >= 3:
+                    import traceback
+                    traceback.print_exc()
+                continue
+
+            if transformed:
+                yield transformed
+
     def transform_entry(self, entry):
         """Transform an entry - must be implemented by subclasses."""
         raise NotImplementedError("Subclasses must implement transform_entry()")
@@ -194,6 +244,81 @@ class BaseImporter(BaseCommand):
         """Save an entry - must be implemented by subclasses."""
         raise NotImplementedError("Subclasses must implement save_entry()")
 
+    def flush_pending(self, model, unique_fields, update_fields, batch_size=500):
+        """
+        Upsert the instances queued in self._pending with bulk_create, matching
+        existing rows on unique_fields and overwriting update_fields.
+
+        The upsert runs under a savepoint. If it fails, each row is retried under its
+        own savepoint, so a bad row is recorded as an error and costs only that entry,
+        as with per-row update_or_create, and the surrounding transaction stays usable.
+        Only rows that were actually written are counted and logged.
+        """
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+
+        def key(obj):
+            return tuple(getattr(obj, field) for field in unique_fields)
+
+        def upsert(objs):
+            with transaction.atomic():
+                model.objects.bulk_create(
+                    objs,
+                    batch_size=batch_size,
+                    update_conflicts=True,
+                    unique_fields=unique_fields,
+                    update_fields=update_fields,
+                )
+
+        # Look up which rows already exist so created/updated counts stay accurate
+        verbose_name = model._meta.verbose_name
+        first_field = unique_fields[0]
+        try:
+            with transaction.atomic():
+                existing = set(
+                    model.objects.filter(
+                        **{f'{first_field}__in': {getattr(obj, first_field) for obj in pending}}
+                    ).values_list(*unique_fields)
+                )
+        except Exception as e:
+            # Without the lookup nothing can be counted, so the whole batch is dropped
+            self.errors.append(f"Failed to save {model._meta.verbose_name_plural}: {str(e)}")
+            self.log(f"Failed to save {model._meta.verbose_name_plural}: {str(e)}", level=1, style=self.style.ERROR)
+            return
+
+        # A later entry with the same key replaces the earlier one, as sequential
+        # update_or_create calls would; the database rejects duplicates in one upsert
+        latest = {key(obj): obj for obj in pending}
+
+        try:
+            upsert(list(latest.values()))
+            saved = set(latest)
+        except Exception:
+            saved = set()
+            for obj_key, obj in latest.items():
+                try:
+                    upsert([obj])
+                except Exception as e:
+                    self.errors.append(f"Failed to save {verbose_name} {obj}: {str(e)}")
+                    self.log(f"Failed to save {verbose_name} {obj}: {str(e)}", level=1, style=self.style.ERROR)
+                else:
+                    saved.add(obj_key)
+
+        for obj in pending:
+            obj_key = key(obj)
+            if obj_key not in saved:
+                continue
+            if obj_key in existing:
+                self.updated_count += 1
+                if self.verbosity >= 2:
+                    self.log(f"Updated {verbose_name}: {obj}", level=2)
+            else:
+                self.created_count += 1
+                existing.add(obj_key)
+                if self.verbosity >= 2:
+                    self.log(f"Created {verbose_name}: {obj}", level=2, style=self.style.SUCCESS)
+
     def print_summary(self):
         """Print import summary."""
         self.stdout.write("\n" + "="*50)
@@ -7,19 +7,33 @@ Usage:
     python manage.py import_backgrounds --clear
 """
 
+import re
+
 from .base_importer import BaseImporter
 from game_content.models import Background
 
+# Skill keys in skillProficiencies entries, in the order they're listed
+SKILL_NAMES = (
+    'athletics', 'acrobatics', 'sleight of hand', 'stealth',
+    'arcana', 'history', 'investigation', 'nature', 'religion',
+    'animal handling', 'insight', 'medicine', 'perception', 'survival',
+    'deception', 'intimidation', 'performance', 'persuasion',
+)
+
+# Keys of tool/language proficiency entries that describe a choice, not a name
+TOOL_CHOICE_KEYS = frozenset(['choose', 'any'])
+LANGUAGE_CHOICE_KEYS = frozenset(['choose', 'any', 'anyStandard'])
+
+# An amount of gold in equipment text, e.g. "15 gp"
+GOLD_PATTERN = re.compile(r'(\d+)\s*(?:gp|gold)', re.IGNORECASE)
+
 
 class Command(BaseImporter):
     help = 'Import D&D 5e backgrounds from backgrounds.json'
 
     def clear_existing_data(self):
         """Clear existing backgrounds data."""
-        if Background.objects.exists():
-            count = Background.objects.count()
-            Background.objects.all().delete()
-            self.log(f"Deleted {count} existing backgrounds", style=self.style.WARNING)
+        self.delete_all(Background, 'backgrounds')
 
     def import_data(self):
         """Import backgrounds from backgrounds.json."""
@@ -37,27 +51,17 @@ class Command(BaseImporter):
             return
 
         # Process each background
-        for bg_data in backgrounds:
-            try:
-                if not self.is_valid_entry(bg_data):
-                    self.skipped_count += 1
-                    self.log(f"Skipping {bg_data.get('name', 'Unknown')} from {bg_data.get('source', 'Unknown')}", level=2)
-                    continue
-
-                if self.validate_entry(bg_data):
-                    transformed = self.transform_entry(bg_data)
-                    if transformed:
-                        self.save_entry(transformed)
-                else:
-                    self.skipped_count += 1
-                    self.log(f"Validation failed for {bg_data.get('name', 'Unknown')}", level=2, style=self.style.WARNING)
-
-            except Exception as e:
-                self.errors.append(f"Error processing background {bg_data.get('name', 'Unknown')}: {str(e)}")
-                self.log(f"Error processing background: {str(e)}", level=1, style=self.style.ERROR)
-                if self.verbosity >= 3:
-                    import traceback
-                    traceback.print_exc()
+        for transformed in self.iter_transformed(backgrounds, 'background'):
+            self.save_entry(transformed)
+
+        self.flush_pending(
+            Background,
+            unique_fields=['name'],
+            update_fields=[
+                'description', 'skill_proficiencies', 'tool_proficiencies',
+                'languages', 'equipment_options', 'starting_gold', 'origin_feat'
+            ]
+        )
 
     def validate_entry(self, entry):
         """Validate a background entry."""
@@ -88,10 +92,7 @@ class Command(BaseImporter):
                                 skills.append(f"Choose {count} from: {', '.join(from_skills)}")
                     else:
                         # Direct skill names
-                        for skill_name in ['athletics', 'acrobatics', 'sleight of hand', 'stealth',
-                                         'arcana', 'history', 'investigation', 'nature', 'religion',
-                                         'animal handling', 'insight', 'medicine', 'perception', 'survival',
-                                         'deception', 'intimidation', 'performance', 'persuasion']:
+                        for skill_name in SKILL_NAMES:
                             if skill.get(skill_name):
                                 skills.append(skill_name.title())
                 elif isinstance(skill, str):
@@ -121,7 +122,7 @@ class Command(BaseImporter):
                         # Direct tool names
                         tool_names = []
                         for key, value in tool.items():
-                            if value and key not in ['choose', 'any']:
+                            if value and key not in TOOL_CHOICE_KEYS:
                                 tool_names.append(key.replace('_', ' ').title())
                         tools.extend(tool_names)
                 elif isinstance(tool, str):
@@ -154,7 +155,7 @@ class Command(BaseImporter):
                     else:
                         # Direct language names
                         for key, value in lang.items():
-                            if value and key not in ['choose', 'any', 'anyStandard']:
+                            if value and key not in LANGUAGE_CHOICE_KEYS:
                                 languages.append(key.title())
                 elif isinstance(lang, str):
                     languages.append(lang)
@@ -201,10 +202,14 @@ class Command(BaseImporter):
         # Check entries for gold information
         if 'entries' in bg_data:
             for entry in bg_data['entries']:
-                if isinstance(entry, dict) and 'gold' in str(entry).lower():
+                if not isinstance(entry, dict):
+                    continue
+                # Gold amounts can sit anywhere in the nested entry, so search its
+                # whole text, rendered once
+                entry_text = str(entry)
+                if 'gold' in entry_text.lower():
                     # Try to extract number from text
-                    import re
-                    match = re.search(r'(\d+)\s*(?:gp|gold)', str(entry), re.IGNORECASE)
+                    match = GOLD_PATTERN.search(entry_text)
                     if match:
                         return int(match.group(1))
 
@@ -242,26 +247,12 @@ class Command(BaseImporter):
         }
 
     def save_entry(self, transformed_data):
-        """Save or update a background entry."""
-        try:
-            background, created = Background.objects.update_or_create(
-                name=transformed_data['name'],
-                defaults=transformed_data
-            )
-
-            if created:
-                self.created_count += 1
-                self.log(f"Created background: {background.name}", level=2, style=self.style.SUCCESS)
-            else:
-                self.updated_count += 1
-                self.log(f"Updated background: {background.name}", level=2)
-
-            # Log details at higher verbosity
-            if self.verbosity >= 3:
-                self.log(f"  Skills: {', '.join(background.skill_proficiencies) if background.skill_proficiencies else 'None'}", level=3)
-                self.log(f"  Tools: {', '.join(background.tool_proficiencies) if background.tool_proficiencies else 'None'}", level=3)
-                self.log(f"  Languages: {', '.join(background.languages) if background.languages else 'None'}", level=3)
-
-        except Exception as e:
-            self.errors.append(f"Failed to save background {transformed_data['name']}: {str(e)}")
-            self.log(f"Failed to save background: {str(e)}", level=1, style=self.style.ERROR)
\ No newline at end of file
+        """Queue a background for the bulk upsert at the end of import_data."""
+        background = Background(**transformed_data)
+        self._pending.append(background)
+
+        # Log details at higher verbosity
+        if self.verbosity >= 3:
+            self.log(f"  Skills: {', '.join(background.skill_proficiencies) if background.skill_proficiencies else 'None'}", level=3)
+            self.log(f"  Tools: {', '.join(background.tool_proficiencies) if background.tool_proficiencies else 'None'}", level=3)
+            self.log(f"  Languages: {', '.join(background.languages) if background.languages else 'None'}", level=3)
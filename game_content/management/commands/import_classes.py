@@ -9,6 +9,10 @@ Usage:
 
 import os
 from pathlib import Path
+
+import orjson
+from django.db import transaction
+
 from .base_importer import BaseImporter
 from game_content.models import DnDClass, ClassFeature, Subclass
 
@@ -19,20 +23,9 @@ class Command(BaseImporter):
     def clear_existing_data(self):
         """Clear existing class data."""
         # Delete in reverse order due to foreign keys
-        if Subclass.objects.exists():
-            count = Subclass.objects.count()
-            Subclass.objects.all().delete()
-            self.log(f"Deleted {count} existing subclasses", style=self.style.WARNING)
-
-        if ClassFeature.objects.exists():
-            count = ClassFeature.objects.count()
-            ClassFeature.objects.all().delete()
-            self.log(f"Deleted {count} existing class features", style=self.style.WARNING)
-
-        if DnDClass.objects.exists():
-            count = DnDClass.objects.count()
-            DnDClass.objects.all().delete()
-            self.log(f"Deleted {count} existing classes", style=self.style.WARNING)
+        self.delete_all(Subclass, 'subclasses')
+        self.delete_all(ClassFeature, 'class features')
+        self.delete_all(DnDClass, 'classes')
 
     def import_data(self):
         """Import classes from class/*.json files."""
@@ -50,10 +43,8 @@ class Command(BaseImporter):
 
             # Load the JSON file
             try:
-                with open(class_file, 'r', encoding='utf-8') as f:
-                    import json
-                    data = json.load(f)
-                    self.log(f"Loaded {class_file.name}", level=2)
+                data = orjson.loads(class_file.read_bytes())
+                self.log(f"Loaded {class_file.name}", level=2)
             except Exception as e:
                 self.errors.append(f"Error loading {class_file.name}: {str(e)}")
                 self.log(f"Error loading {class_file.name}: {str(e)}", level=1, style=self.style.ERROR)
@@ -65,28 +56,32 @@ class Command(BaseImporter):
                 self.log(f"No classes found in {class_file.name}", style=self.style.WARNING)
                 continue
 
-            # Process each class
-            for class_data in classes:
-                try:
-                    if not self.is_valid_entry(class_data):
-                        self.skipped_count += 1
-                        self.log(f"Skipping {class_data.get('name', 'Unknown')} from {class_data.get('source', 'Unknown')}", level=2)
-                        continue
-
-                    if self.validate_entry(class_data):
-                        transformed = self.transform_entry(class_data)
-                        if transformed:
-                            self.save_entry(transformed)
-                    else:
-                        self.skipped_count += 1
-                        self.log(f"Validation failed for {class_data.get('name', 'Unknown')}", level=2, style=self.style.WARNING)
-
-                except Exception as e:
-                    self.errors.append(f"Error processing class {class_data.get('name', 'Unknown')}: {str(e)}")
-                    self.log(f"Error processing class: {str(e)}", level=1, style=self.style.ERROR)
-                    if self.verbosity >= 3:
-                        import traceback
-                        traceback.print_exc()
+            # Process each class, committing the whole file together (a savepoint
+            # when handle() already holds the outer transaction)
+            with transaction.atomic():
+                for class_data in classes:
+                    try:
+                        if not self.is_valid_entry(class_data):
+                            self.skipped_count += 1
+                            if self.verbosity >= 2:
+                                self.log(f"Skipping {class_data.get('name', 'Unknown')} from {class_data.get('source', 'Unknown')}", level=2)
+                            continue
+
+                        if self.validate_entry(class_data):
+                            transformed = self.transform_entry(class_data)
+                            if transformed:
+                                self.save_entry(transformed)
+                        else:
+                            self.skipped_count += 1
+                            if self.verbosity >= 2:
+                                self.log(f"Validation failed for {class_data.get('name', 'Unknown')}", level=2, style=self.style.WARNING)
+
+                    except Exception as e:
+                        self.errors.append(f"Error processing class {class_data.get('name', 'Unknown')}: {str(e)}")
+                        self.log(f"Error processing class: {str(e)}", level=1, style=self.style.ERROR)
+                        if self.verbosity >= 3:
+                            import traceback
+                            traceback.print_exc()
 
     def validate_entry(self, entry):
         """Validate a class entry."""
@@ -319,55 +314,69 @@ class Command(BaseImporter):
     def save_entry(self, transformed_data):
         """Save or update a class entry."""
         try:
-            # Extract features and subclasses before saving class
-            features = transformed_data.pop('features', [])
-            subclasses = transformed_data.pop('subclasses', [])
-
-            dnd_class, created = DnDClass.objects.update_or_create(
-                name=transformed_data['name'],
-                defaults=transformed_data
-            )
+            # Savepoint per class, so a failed insert rolls back only this class and
+            # leaves the file's transaction usable for the rest
+            with transaction.atomic():
+                # Extract features and subclasses before saving class
+                features = transformed_data.pop('features', [])
+                subclasses = transformed_data.pop('subclasses', [])
+
+                dnd_class, created = DnDClass.objects.update_or_create(
+                    name=transformed_data['name'],
+                    defaults=transformed_data
+                )
+
+                # Handle features
+                if features:
+                    # Clear existing features if updating
+                    if not created:
+                        dnd_class.features.all().delete()
+
+                    # Add new features in one INSERT rather than one per feature
+                    ClassFeature.objects.bulk_create([
+                        ClassFeature(
+                            dnd_class=dnd_class,
+                            name=feature_data['name'],
+                            level_acquired=feature_data['level'],
+                            description=feature_data['description'],
+                            feature_type=feature_data['type'],
+                            choice_options=feature_data.get('choices', [])
+                        )
+                        for feature_data in features
+                    ], batch_size=500)
+                    if self.verbosity >= 3:
+                        for feature_data in features:
+                            self.log(f"  Added feature: {feature_data['name']} (Level {feature_data['level']})", level=3)
+
+                # Handle subclasses
+                if subclasses:
+                    # Clear existing subclasses if updating
+                    if not created:
+                        dnd_class.subclasses.all().delete()
+
+                    # Add new subclasses in one INSERT
+                    Subclass.objects.bulk_create([
+                        Subclass(
+                            dnd_class=dnd_class,
+                            name=subclass_data['name'],
+                            description=subclass_data['description'],
+                            level_available=subclass_data['level_available']
+                        )
+                        for subclass_data in subclasses
+                    ], batch_size=500)
+                    if self.verbosity >= 3:
+                        for subclass_data in subclasses:
+                            self.log(f"  Added subclass: {subclass_data['name']}", level=3)
 
+            # Counted only once the class and its children are saved
             if created:
                 self.created_count += 1
-                self.log(f"Created class: {dnd_class.name}", level=2, style=self.style.SUCCESS)
+                if self.verbosity >= 2:
+                    self.log(f"Created class: {dnd_class.name}", level=2, style=self.style.SUCCESS)
             else:
                 self.updated_count += 1
-                self.log(f"Updated class: {dnd_class.name}", level=2)
-
-            # Handle features
-            if features:
-                # Clear existing features if updating
-                if not created:
-                    dnd_class.features.all().delete()
-
-                # Add new features
-                for feature_data in features:
-                    ClassFeature.objects.create(
-                        dnd_class=dnd_class,
-                        name=feature_data['name'],
-                        level_acquired=feature_data['level'],
-                        description=feature_data['description'],
-                        feature_type=feature_data['type'],
-                        choice_options=feature_data.get('choices', [])
-                    )
-                    self.log(f"  Added feature: {feature_data['name']} (Level {feature_data['level']})", level=3)
-
-            # Handle subclasses
-            if subclasses:
-                # Clear existing subclasses if updating
-                if not created:
-                    dnd_class.subclasses.all().delete()
-
-                # Add new subclasses
-                for subclass_data in subclasses:
-                    Subclass.objects.create(
-                        dnd_class=dnd_class,
-                        name=subclass_data['name'],
-                        description=subclass_data['description'],
-                        level_available=subclass_data['level_available']
-                    )
-                    self.log(f"  Added subclass: {subclass_data['name']}", level=3)
+                if self.verbosity >= 2:
+                    self.log(f"Updated class: {dnd_class.name}", level=2)
 
         except Exception as e:
             self.errors.append(f"Failed to save class {transformed_data['name']}: {str(e)}")
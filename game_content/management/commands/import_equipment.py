@@ -79,20 +79,9 @@ class Command(BaseImporter):
     def clear_existing_data(self):
         """Clear existing equipment data."""
         # Delete in reverse order due to inheritance
-        if Weapon.objects.exists():
-            count = Weapon.objects.count()
-            Weapon.objects.all().delete()
-            self.log(f"Deleted {count} existing weapons", style=self.style.WARNING)
-
-        if Armor.objects.exists():
-            count = Armor.objects.count()
-            Armor.objects.all().delete()
-            self.log(f"Deleted {count} existing armor", style=self.style.WARNING)
-
-        if Equipment.objects.exists():
-            count = Equipment.objects.count()
-            Equipment.objects.all().delete()
-            self.log(f"Deleted {count} existing equipment", style=self.style.WARNING)
+        self.delete_all(Weapon, 'weapons')
+        self.delete_all(Armor, 'armor')
+        self.delete_all(Equipment, 'equipment')
 
     def import_data(self):
         """Import equipment from JSON files."""
@@ -121,7 +110,8 @@ class Command(BaseImporter):
             try:
                 if not self.is_valid_entry(item_data):
                     self.skipped_count += 1
-                    self.log(f"Skipping {item_data.get('name', 'Unknown')} from {item_data.get('source', 'Unknown')}", level=2)
+                    if self.verbosity >= 2:
+                        self.log(f"Skipping {item_data.get('name', 'Unknown')} from {item_data.get('source', 'Unknown')}", level=2)
                     continue
 
                 if self.validate_entry(item_data):
@@ -130,7 +120,8 @@ class Command(BaseImporter):
                         self.save_entry(transformed)
                 else:
                     self.skipped_count += 1
-                    self.log(f"Validation failed for {item_data.get('name', 'Unknown')}", level=2, style=self.style.WARNING)
+                    if self.verbosity >= 2:
+                        self.log(f"Validation failed for {item_data.get('name', 'Unknown')}", level=2, style=self.style.WARNING)
 
             except Exception as e:
                 self.errors.append(f"Error processing item {item_data.get('name', 'Unknown')}: {str(e)}")
@@ -158,12 +149,14 @@ class Command(BaseImporter):
                 # Skip magic items for now (rarity other than 'none')
                 if item_data.get('rarity', 'none') != 'none':
                     self.skipped_count += 1
-                    self.log(f"Skipping magic item: {item_data.get('name', 'Unknown')}", level=3)
+                    if self.verbosity >= 3:
+                        self.log(f"Skipping magic item: {item_data.get('name', 'Unknown')}", level=3)
                     continue
 
                 if not self.is_valid_entry(item_data):
                     self.skipped_count += 1
-                    self.log(f"Skipping {item_data.get('name', 'Unknown')} from {item_data.get('source', 'Unknown')}", level=2)
+                    if self.verbosity >= 2:
+                        self.log(f"Skipping {item_data.get('name', 'Unknown')} from {item_data.get('source', 'Unknown')}", level=2)
                     continue
 
                 if self.validate_entry(item_data):
@@ -172,7 +165,8 @@ class Command(BaseImporter):
                         self.save_entry(transformed)
                 else:
                     self.skipped_count += 1
-                    self.log(f"Validation failed for {item_data.get('name', 'Unknown')}", level=2, style=self.style.WARNING)
+                    if self.verbosity >= 2:
+                        self.log(f"Validation failed for {item_data.get('name', 'Unknown')}", level=2, style=self.style.WARNING)
 
             except Exception as e:
                 self.errors.append(f"Error processing item {item_data.get('name', 'Unknown')}: {str(e)}")
@@ -191,7 +185,8 @@ class Command(BaseImporter):
         # Check if we can determine the type
         item_type = entry.get('type')
         if item_type and item_type not in self.TYPE_MAP:
-            self.log(f"Unknown item type '{item_type}' for {entry.get('name')}", level=2, style=self.style.WARNING)
+            if self.verbosity >= 2:
+                self.log(f"Unknown item type '{item_type}' for {entry.get('name')}", level=2, style=self.style.WARNING)
 
         return True
 
@@ -391,10 +386,12 @@ class Command(BaseImporter):
 
                 if created:
                     self.created_count += 1
-                    self.log(f"Created weapon: {weapon.name}", level=2, style=self.style.SUCCESS)
+                    if self.verbosity >= 2:
+                        self.log(f"Created weapon: {weapon.name}", level=2, style=self.style.SUCCESS)
                 else:
                     self.updated_count += 1
-                    self.log(f"Updated weapon: {weapon.name}", level=2)
+                    if self.verbosity >= 2:
+                        self.log(f"Updated weapon: {weapon.name}", level=2)
 
             elif item_type == 'armor':
                 # Combine base and armor-specific data
@@ -407,10 +404,12 @@ class Command(BaseImporter):
 
                 if created:
                     self.created_count += 1
-                    self.log(f"Created armor: {armor.name}", level=2, style=self.style.SUCCESS)
+                    if self.verbosity >= 2:
+                        self.log(f"Created armor: {armor.name}", level=2, style=self.style.SUCCESS)
                 else:
                     self.updated_count += 1
-                    self.log(f"Updated armor: {armor.name}", level=2)
+                    if self.verbosity >= 2:
+                        self.log(f"Updated armor: {armor.name}", level=2)
 
             else:
                 # Regular equipment
@@ -421,10 +420,12 @@ class Command(BaseImporter):
 
                 if created:
                     self.created_count += 1
-                    self.log(f"Created equipment: {equipment.name}", level=2, style=self.style.SUCCESS)
+                    if self.verbosity >= 2:
+                        self.log(f"Created equipment: {equipment.name}", level=2, style=self.style.SUCCESS)
                 else:
                     self.updated_count += 1
-                    self.log(f"Updated equipment: {equipment.name}", level=2)
+                    if self.verbosity >= 2:
+                        self.log(f"Updated equipment: {equipment.name}", level=2)
 
         except Exception as e:
             self.errors.append(f"Failed to save equipment {base_data['name']}: {str(e)}")
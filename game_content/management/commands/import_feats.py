@@ -17,10 +17,7 @@ class Command(BaseImporter):
 
     def clear_existing_data(self):
         """Clear existing feats data."""
-        if Feat.objects.exists():
-            count = Feat.objects.count()
-            Feat.objects.all().delete()
-            self.log(f"Deleted {count} existing feats", style=self.style.WARNING)
+        self.delete_all(Feat, 'feats')
 
     def import_data(self):
         """Import feats from feats.json."""
@@ -38,27 +35,17 @@ class Command(BaseImporter):
             return
 
         # Process each feat
-        for feat_data in feats:
-            try:
-                if not self.is_valid_entry(feat_data):
-                    self.skipped_count += 1
-                    self.log(f"Skipping {feat_data.get('name', 'Unknown')} from {feat_data.get('source', 'Unknown')}", level=2)
-                    continue
-
-                if self.validate_entry(feat_data):
-                    transformed = self.transform_entry(feat_data)
-                    if transformed:
-                        self.save_entry(transformed)
-                else:
-                    self.skipped_count += 1
-                    self.log(f"Validation failed for {feat_data.get('name', 'Unknown')}", level=2, style=self.style.WARNING)
-
-            except Exception as e:
-                self.errors.append(f"Error processing feat {feat_data.get('name', 'Unknown')}: {str(e)}")
-                self.log(f"Error processing feat: {str(e)}", level=1, style=self.style.ERROR)
-                if self.verbosity >= 3:
-                    import traceback
-                    traceback.print_exc()
+        for transformed in self.iter_transformed(feats, 'feat'):
+            self.save_entry(transformed)
+
+        self.flush_pending(
+            Feat,
+            unique_fields=['name'],
+            update_fields=[
+                'feat_type', 'description', 'repeatable', 'prerequisites',
+                'ability_score_increase', 'benefits'
+            ]
+        )
 
     def validate_entry(self, entry):
         """Validate a feat entry."""
@@ -227,29 +214,15 @@ class Command(BaseImporter):
         }
 
     def save_entry(self, transformed_data):
-        """Save or update a feat entry."""
-        try:
-            feat, created = Feat.objects.update_or_create(
-                name=transformed_data['name'],
-                defaults=transformed_data
-            )
-
-            if created:
-                self.created_count += 1
-                self.log(f"Created feat: {feat.name} ({feat.feat_type})", level=2, style=self.style.SUCCESS)
-            else:
-                self.updated_count += 1
-                self.log(f"Updated feat: {feat.name} ({feat.feat_type})", level=2)
-
-            # Log details at higher verbosity
-            if self.verbosity >= 3:
-                if feat.prerequisites:
-                    self.log(f"  Prerequisites: {feat.prerequisites}", level=3)
-                if feat.ability_score_increase:
-                    self.log(f"  ASI: {feat.ability_score_increase}", level=3)
-                if len(feat.benefits) > 0:
-                    self.log(f"  Benefits: {len(feat.benefits)} entries", level=3)
-
-        except Exception as e:
-            self.errors.append(f"Failed to save feat {transformed_data['name']}: {str(e)}")
-            self.log(f"Failed to save feat: {str(e)}", level=1, style=self.style.ERROR)
\ No newline at end of file
+        """Queue a feat for the bulk upsert at the end of import_data."""
+        feat = Feat(**transformed_data)
+        self._pending.append(feat)
+
+        # Log details at higher verbosity
+        if self.verbosity >= 3:
+            if feat.prerequisites:
+                self.log(f"  Prerequisites: {feat.prerequisites}", level=3)
+            if feat.ability_score_increase:
+                self.log(f"  ASI: {feat.ability_score_increase}", level=3)
+            if len(feat.benefits) > 0:
+                self.log(f"  Benefits: {len(feat.benefits)} entries", level=3)
@@ -17,10 +17,7 @@ class Command(BaseImporter):
 
     def clear_existing_data(self):
         """Clear existing languages data."""
-        if Language.objects.exists():
-            count = Language.objects.count()
-            Language.objects.all().delete()
-            self.log(f"Deleted {count} existing languages", style=self.style.WARNING)
+        self.delete_all(Language, 'languages')
 
     def import_data(self):
         """Import languages from languages.json."""
@@ -38,27 +35,16 @@ class Command(BaseImporter):
             return
 
         # Process each language
-        for lang_data in languages:
-            try:
-                if not self.is_valid_entry(lang_data):
-                    self.skipped_count += 1
-                    self.log(f"Skipping {lang_data.get('name', 'Unknown')} from {lang_data.get('source', 'Unknown')}", level=2)
-                    continue
-
-                if self.validate_entry(lang_data):
-                    transformed = self.transform_entry(lang_data)
-                    if transformed:
-                        self.save_entry(transformed)
-                else:
-                    self.skipped_count += 1
-                    self.log(f"Validation failed for {lang_data.get('name', 'Unknown')}", level=2, style=self.style.WARNING)
-
-            except Exception as e:
-                self.errors.append(f"Error processing language {lang_data.get('name', 'Unknown')}: {str(e)}")
-                self.log(f"Error processing language: {str(e)}", level=1, style=self.style.ERROR)
-                if self.verbosity >= 3:
-                    import traceback
-                    traceback.print_exc()
+        for transformed in self.iter_transformed(languages, 'language'):
+            self.save_entry(transformed)
+
+        self.flush_pending(
+            Language,
+            unique_fields=['name'],
+            update_fields=[
+                'script', 'typical_speakers', 'rarity'
+            ]
+        )
 
     def validate_entry(self, entry):
         """Validate a language entry."""
@@ -165,24 +151,10 @@ class Command(BaseImporter):
         }
 
     def save_entry(self, transformed_data):
-        """Save or update a language entry."""
-        try:
-            language, created = Language.objects.update_or_create(
-                name=transformed_data['name'],
-                defaults={
-                    'script': transformed_data['script'],
-                    'typical_speakers': transformed_data['typical_speakers'],
-                    'rarity': transformed_data['rarity']
-                }
-            )
-
-            if created:
-                self.created_count += 1
-                self.log(f"Created language: {language.name} ({language.rarity})", level=2, style=self.style.SUCCESS)
-            else:
-                self.updated_count += 1
-                self.log(f"Updated language: {language.name} ({language.rarity})", level=2)
-
-        except Exception as e:
-            self.errors.append(f"Failed to save language {transformed_data['name']}: {str(e)}")
-            self.log(f"Failed to save language: {str(e)}", level=1, style=self.style.ERROR)
\ No newline at end of file
+        """Queue a language for the bulk upsert at the end of import_data."""
+        self._pending.append(Language(
+            name=transformed_data['name'],
+            script=transformed_data['script'],
+            typical_speakers=transformed_data['typical_speakers'],
+            rarity=transformed_data['rarity']
+        ))
@@ -16,10 +16,7 @@ class Command(BaseImporter):
 
     def clear_existing_data(self):
         """Clear existing skills data."""
-        if Skill.objects.exists():
-            count = Skill.objects.count()
-            Skill.objects.all().delete()
-            self.log(f"Deleted {count} existing skills", style=self.style.WARNING)
+        self.delete_all(Skill, 'skills')
 
     def import_data(self):
         """Import skills from skills.json."""
@@ -37,27 +34,16 @@ class Command(BaseImporter):
             return
 
         # Process each skill
-        for skill_data in skills:
-            try:
-                if not self.is_valid_entry(skill_data):
-                    self.skipped_count += 1
-                    self.log(f"Skipping {skill_data.get('name', 'Unknown')} from {skill_data.get('source', 'Unknown')}", level=2)
-                    continue
-
-                if self.validate_entry(skill_data):
-                    transformed = self.transform_entry(skill_data)
-                    if transformed:
-                        self.save_entry(transformed)
-                else:
-                    self.skipped_count += 1
-                    self.log(f"Validation failed for {skill_data.get('name', 'Unknown')}", level=2, style=self.style.WARNING)
-
-            except Exception as e:
-                self.errors.append(f"Error processing skill {skill_data.get('name', 'Unknown')}: {str(e)}")
-                self.log(f"Error processing skill: {str(e)}", level=1, style=self.style.ERROR)
-                if self.verbosity >= 3:
-                    import traceback
-                    traceback.print_exc()
+        for transformed in self.iter_transformed(skills, 'skill'):
+            self.save_entry(transformed)
+
+        self.flush_pending(
+            Skill,
+            unique_fields=['name'],
+            update_fields=[
+                'associated_ability', 'description'
+            ]
+        )
 
     def validate_entry(self, entry):
         """Validate a skill entry."""
@@ -111,23 +97,9 @@ class Command(BaseImporter):
         }
 
     def save_entry(self, transformed_data):
-        """Save or update a skill entry."""
-        try:
-            skill, created = Skill.objects.update_or_create(
-                name=transformed_data['name'],
-                defaults={
-                    'associated_ability': transformed_data['associated_ability'],
-                    'description': transformed_data['description']
-                }
-            )
-
-            if created:
-                self.created_count += 1
-                self.log(f"Created skill: {skill.name}", level=2, style=self.style.SUCCESS)
-            else:
-                self.updated_count += 1
-                self.log(f"Updated skill: {skill.name}", level=2)
-
-        except Exception as e:
-            self.errors.append(f"Failed to save skill {transformed_data['name']}: {str(e)}")
-            self.log(f"Failed to save skill: {str(e)}", level=1, style=self.style.ERROR)
\ No newline at end of file
+        """Queue a skill for the bulk upsert at the end of import_data."""
+        self._pending.append(Skill(
+            name=transformed_data['name'],
+            associated_ability=transformed_data['associated_ability'],
+            description=transformed_data['description']
+        ))
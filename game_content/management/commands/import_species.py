@@ -18,15 +18,8 @@ class Command(BaseImporter):
     def clear_existing_data(self):
         """Clear existing species and traits data."""
         # Delete in reverse order due to foreign key
-        if SpeciesTrait.objects.exists():
-            count = SpeciesTrait.objects.count()
-            SpeciesTrait.objects.all().delete()
-            self.log(f"Deleted {count} existing species traits", style=self.style.WARNING)
-
-        if Species.objects.exists():
-            count = Species.objects.count()
-            Species.objects.all().delete()
-            self.log(f"Deleted {count} existing species", style=self.style.WARNING)
+        self.delete_all(SpeciesTrait, 'species traits')
+        self.delete_all(Species, 'species')
 
     def import_data(self):
         """Import species from races.json."""
@@ -48,7 +41,8 @@ class Command(BaseImporter):
             try:
                 if not self.is_valid_entry(race_data):
                     self.skipped_count += 1
-                    self.log(f"Skipping {race_data.get('name', 'Unknown')} from {race_data.get('source', 'Unknown')}", level=2)
+                    if self.verbosity >= 2:
+                        self.log(f"Skipping {race_data.get('name', 'Unknown')} from {race_data.get('source', 'Unknown')}", level=2)
                     continue
 
                 if self.validate_entry(race_data):
@@ -57,7 +51,8 @@ class Command(BaseImporter):
                         self.save_entry(transformed)
                 else:
                     self.skipped_count += 1
-                    self.log(f"Validation failed for {race_data.get('name', 'Unknown')}", level=2, style=self.style.WARNING)
+                    if self.verbosity >= 2:
+                        self.log(f"Validation failed for {race_data.get('name', 'Unknown')}", level=2, style=self.style.WARNING)
 
             except Exception as e:
                 self.errors.append(f"Error processing race {race_data.get('name', 'Unknown')}: {str(e)}")
@@ -231,10 +226,12 @@ class Command(BaseImporter):
 
             if created:
                 self.created_count += 1
-                self.log(f"Created species: {species.name}", level=2, style=self.style.SUCCESS)
+                if self.verbosity >= 2:
+                    self.log(f"Created species: {species.name}", level=2, style=self.style.SUCCESS)
             else:
                 self.updated_count += 1
-                self.log(f"Updated species: {species.name}", level=2)
+                if self.verbosity >= 2:
+                    self.log(f"Updated species: {species.name}", level=2)
 
             # Handle traits
             if traits:
@@ -251,7 +248,8 @@ class Command(BaseImporter):
                         trait_type=trait_data['trait_type'],
                         mechanical_effect=trait_data.get('mechanical_effect', {})
                     )
-                    self.log(f"  Added trait: {trait_data['name']}", level=3)
+                    if self.verbosity >= 3:
+                        self.log(f"  Added trait: {trait_data['name']}", level=3)
 
         except Exception as e:
             self.errors.append(f"Failed to save species {transformed_data['name']}: {str(e)}")
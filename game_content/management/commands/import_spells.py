@@ -9,6 +9,9 @@ Usage:
 
 import os
 from pathlib import Path
+
+import orjson
+
 from .base_importer import BaseImporter
 from game_content.models import Spell, DnDClass
 
@@ -18,10 +21,7 @@ class Command(BaseImporter):
 
     def clear_existing_data(self):
         """Clear existing spell data."""
-        if Spell.objects.exists():
-            count = Spell.objects.count()
-            Spell.objects.all().delete()
-            self.log(f"Deleted {count} existing spells", style=self.style.WARNING)
+        self.delete_all(Spell, 'spells')
 
     def import_data(self):
         """Import spells from spells/*.json files."""
@@ -44,10 +44,8 @@ class Command(BaseImporter):
 
             # Load the JSON file
             try:
-                with open(spell_file, 'r', encoding='utf-8') as f:
-                    import json
-                    data = json.load(f)
-                    self.log(f"Loaded {spell_file.name}", level=2)
+                data = orjson.loads(spell_file.read_bytes())
+                self.log(f"Loaded {spell_file.name}", level=2)
             except Exception as e:
                 self.errors.append(f"Error loading {spell_file.name}: {str(e)}")
                 self.log(f"Error loading {spell_file.name}: {str(e)}", level=1, style=self.style.ERROR)
@@ -60,27 +58,20 @@ class Command(BaseImporter):
                 continue
 
             # Process each spell
-            for spell_data in spells:
-                try:
-                    if not self.is_valid_entry(spell_data):
-                        self.skipped_count += 1
-                        self.log(f"Skipping {spell_data.get('name', 'Unknown')} from {spell_data.get('source', 'Unknown')}", level=2)
-                        continue
-
-                    if self.validate_entry(spell_data):
-                        transformed = self.transform_entry(spell_data)
-                        if transformed:
-                            self.save_entry(transformed)
-                    else:
-                        self.skipped_count += 1
-                        self.log(f"Validation failed for {spell_data.get('name', 'Unknown')}", level=2, style=self.style.WARNING)
-
-                except Exception as e:
-                    self.errors.append(f"Error processing spell {spell_data.get('name', 'Unknown')}: {str(e)}")
-                    self.log(f"Error processing spell: {str(e)}", level=1, style=self.style.ERROR)
-                    if self.verbosity >= 3:
-                        import traceback
-                        traceback.print_exc()
+            for transformed in self.iter_transformed(spells, 'spell'):
+                self.save_entry(transformed)
+
+        # One upsert for every file, so a spell reprinted in a later file still wins
+        self.flush_pending(
+            Spell,
+            unique_fields=['name'],
+            update_fields=[
+                'spell_level', 'school', 'casting_time', 'range', 'duration',
+                'concentration', 'ritual', 'components_v', 'components_s',
+                'components_m', 'material_components', 'description',
+                'higher_level_description'
+            ]
+        )
 
     def validate_entry(self, entry):
         """Validate a spell entry."""
@@ -348,20 +339,5 @@ class Command(BaseImporter):
         }
 
     def save_entry(self, transformed_data):
-        """Save or update a spell entry."""
-        try:
-            spell, created = Spell.objects.update_or_create(
-                name=transformed_data['name'],
-                defaults=transformed_data
-            )
-
-            if created:
-                self.created_count += 1
-                self.log(f"Created spell: {spell.name}", level=2, style=self.style.SUCCESS)
-            else:
-                self.updated_count += 1
-                self.log(f"Updated spell: {spell.name}", level=2)
-
-        except Exception as e:
-            self.errors.append(f"Error saving spell {transformed_data['name']}: {str(e)}")
-            self.log(f"Error saving spell: {str(e)}", level=1, style=self.style.ERROR)
\ No newline at end of file
+        """Queue a spell for the bulk upsert at the end of import_data."""
+        self._pending.append(Spell(**transformed_data))
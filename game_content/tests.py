@@ -1,3 +1,153 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import DatabaseError
 from django.test import TestCase
 
-# Create your tests here.
+from .management.commands import import_classes, import_skills
+from .models import ClassFeature, DnDClass, Skill, Subclass
+
+
+class SkillImportTests(TestCase):
+    """Created/updated counts and failure isolation for the bulk-upsert importers"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.data_dir = Path(tmp.name)
+
+    def write_skills(self, *skills):
+        (self.data_dir / 'skills.json').write_text(json.dumps({'skill': list(skills)}))
+
+    def run_import(self):
+        """Run import_skills and return the command instance for its counters"""
+        command = import_skills.Command(stdout=StringIO())
+        call_command(command, data_dir=str(self.data_dir))
+        return command
+
+    def test_created_then_updated(self):
+        Skill.objects.create(name='Athletics', associated_ability='STR', description='old')
+        self.write_skills(
+            {'name': 'Athletics', 'source': 'PHB', 'ability': 'str', 'entries': ['Climb.']},
+            {'name': 'Stealth', 'source': 'PHB', 'ability': 'dex', 'entries': ['Hide.']},
+            {'name': 'Arcana', 'source': 'XPHB', 'ability': 'int'},
+        )
+
+        command = self.run_import()
+
+        self.assertEqual(
+            (command.created_count, command.updated_count, command.skipped_count), (1, 1, 1)
+        )
+        self.assertEqual(command.errors, [])
+        self.assertEqual(Skill.objects.get(name='Athletics').description, 'Climb.')
+        self.assertTrue(Skill.objects.filter(name='Stealth').exists())
+
+    def test_later_duplicate_wins(self):
+        self.write_skills(
+            {'name': 'Stealth', 'source': 'PHB', 'ability': 'dex', 'entries': ['First.']},
+            {'name': 'Stealth', 'source': 'PHB', 'ability': 'dex', 'entries': ['Second.']},
+        )
+
+        command = self.run_import()
+
+        # Counted as a create then an update, as sequential update_or_create calls were
+        self.assertEqual((command.created_count, command.updated_count), (1, 1))
+        self.assertEqual(Skill.objects.get().description, 'Second.')
+
+    def test_failed_row_is_isolated(self):
+        self.write_skills(
+            {'name': 'Athletics', 'source': 'PHB', 'ability': 'str'},
+            {'name': 'Broken', 'source': 'PHB', 'ability': 'dex'},
+            {'name': 'Stealth', 'source': 'PHB', 'ability': 'dex'},
+        )
+        transform_entry = import_skills.Command.transform_entry
+
+        def transform_with_bad_row(command, entry):
+            transformed = transform_entry(command, entry)
+            if entry['name'] == 'Broken':
+                transformed['description'] = None  # violates NOT NULL on insert
+            return transformed
+
+        with mock.patch.object(import_skills.Command, 'transform_entry', transform_with_bad_row):
+            command = self.run_import()
+
+        # Only the rows actually written are counted; the bad one is a single error
+        self.assertEqual((command.created_count, command.updated_count), (2, 0))
+        self.assertEqual(len(command.errors), 1)
+        self.assertIn('Broken', command.errors[0])
+        self.assertEqual(
+            sorted(Skill.objects.values_list('name', flat=True)), ['Athletics', 'Stealth']
+        )
+
+    def test_failed_lookup_is_one_error(self):
+        self.write_skills(
+            {'name': 'Athletics', 'source': 'PHB', 'ability': 'str'},
+            {'name': 'Stealth', 'source': 'PHB', 'ability': 'dex'},
+        )
+
+        with mock.patch.object(Skill.objects, 'filter', side_effect=DatabaseError('lookup failed')):
+            command = self.run_import()
+
+        self.assertEqual((command.created_count, command.updated_count), (0, 0))
+        self.assertEqual(command.errors, ['Failed to save skills: lookup failed'])
+        self.assertFalse(Skill.objects.exists())
+
+
+class ClassImportTests(TestCase):
+    """Bulk-created features/subclasses and per-class savepoints in import_classes"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.data_dir = Path(tmp.name)
+        (self.data_dir / 'class').mkdir()
+
+    def write_classes(self, *classes):
+        (self.data_dir / 'class' / 'class-test.json').write_text(json.dumps({'class': list(classes)}))
+
+    @staticmethod
+    def class_entry(name, extra_features=()):
+        return {
+            'name': name, 'source': 'PHB', 'hd': {'number': 1, 'faces': 10},
+            'classFeatures': [f'Feature {level}|PHB|{level}' for level in range(1, 4)] + list(extra_features),
+            'subclasses': ['Champion|PHB', 'Battle Master|PHB'],
+        }
+
+    def run_import(self):
+        command = import_classes.Command(stdout=StringIO())
+        call_command(command, data_dir=str(self.data_dir))
+        return command
+
+    def test_import_and_reimport(self):
+        self.write_classes(self.class_entry('Fighter'), self.class_entry('Wizard'))
+
+        command = self.run_import()
+        self.assertEqual((command.created_count, command.updated_count), (2, 0))
+        self.assertEqual(ClassFeature.objects.count(), 6)
+        self.assertEqual(Subclass.objects.count(), 4)
+
+        # Re-importing replaces each class's children rather than adding to them
+        command = self.run_import()
+        self.assertEqual((command.created_count, command.updated_count), (0, 2))
+        self.assertEqual(ClassFeature.objects.count(), 6)
+        self.assertEqual(Subclass.objects.count(), 4)
+
+    def test_failed_class_rolls_back_alone(self):
+        # A repeated feature breaks unique_together on the bulk insert for Fighter only
+        self.write_classes(
+            self.class_entry('Fighter', extra_features=['Feature 1|PHB|1']),
+            self.class_entry('Wizard'),
+        )
+
+        command = self.run_import()
+
+        self.assertEqual((command.created_count, command.updated_count), (1, 0))
+        self.assertEqual(len(command.errors), 1)
+        self.assertIn('Fighter', command.errors[0])
+        self.assertEqual(list(DnDClass.objects.values_list('name', flat=True)), ['Wizard'])
+        self.assertEqual(ClassFeature.objects.count(), 3)
+        self.assertEqual(Subclass.objects.count(), 2)